@@ -1,6 +1,138 @@
 """Async utils."""
+
 import asyncio
-from typing import Any, Coroutine, List
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+# asyncio semaphores are bound to the loop that uses them, so they are kept per
+# loop and per (group, limit)
+LoopSemaphores = Dict[Tuple[Hashable, int], asyncio.Semaphore]
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopSemaphores]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def gather_with_limit(
+    awaitables: List[Awaitable], limit: int, group: Hashable = None
+) -> List[Any]:
+    """
+    Like `asyncio.gather` but at most `limit` awaitables of `group` run at once
+    on the running loop, counting those of all the concurrent calls with the
+    same group and limit. A limit of -1 means no limit.
+    """
+    if limit == -1:
+        return list(await asyncio.gather(*awaitables))
+
+    loop_semaphores = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = loop_semaphores.get((group, limit))
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(limit)
+        loop_semaphores[(group, limit)] = semaphore
+
+    async def run(awaitable: Awaitable) -> Any:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*[run(a) for a in awaitables]))
+
+
+class _Batch:
+    def __init__(self):
+        self.items: List[Any] = []
+        self.futures: List[asyncio.Future] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+# pending batches of one loop by key
+LoopBatches = Dict[Hashable, _Batch]
+
+
+class MicroBatcher:
+    """
+    Collects the items submitted concurrently by different coroutines and
+    processes them together. Items are collected for up to `batch_timeout`
+    seconds or until `batch_size` items are waiting, then
+    `process_batch(key, items)` is called and each caller gets the result at
+    the same position of the returned list. Only the items submitted with the
+    same key share a batch.
+
+    If `process_batch` raises, every caller of the batch gets the exception.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[Hashable, List[Any]], Awaitable[List[Any]]],
+        batch_size: int,
+        batch_timeout: float,
+    ):
+        self.process_batch = process_batch
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        # jobs usually run on the shared executor loop, but aevaluate() runs
+        # them on the loop of the caller and nested executors on a private
+        # loop. The futures of a batch belong to one loop, so pending batches
+        # are kept per loop
+        self._pending: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, LoopBatches
+        ] = weakref.WeakKeyDictionary()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, item: Any, key: Hashable = None) -> asyncio.Future:
+        """Add `item` to the pending batch of `key`, returns its future result."""
+        loop = asyncio.get_running_loop()
+        batches = self._pending.setdefault(loop, {})
+        batch = batches.get(key)
+        if batch is None:
+            batch = _Batch()
+            batch.timer = loop.call_later(self.batch_timeout, self._flush, loop, key)
+            batches[key] = batch
+
+        future = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        if len(batch.items) >= self.batch_size:
+            self._flush(loop, key)
+        return future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, key: Hashable):
+        batch = self._pending.get(loop, {}).pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = loop.create_task(self._process(key, batch))
+        # keep a reference so that the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, key: Hashable, batch: _Batch):
+        try:
+            results = await self.process_batch(key, batch.items)
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
 
 
 def run_async_tasks(
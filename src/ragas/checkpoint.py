@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import typing as t
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ragas.utils import is_nan
+
+if t.TYPE_CHECKING:
+    from ragas.metrics.base import Metric
+
+logger = logging.getLogger(__name__)
+
+# (row fingerprint, metric name, metric config hash)
+CheckpointKey = t.Tuple[str, str, str]
+
+
+def _hash(value: t.Any) -> str:
+    dumped = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(dumped.encode("utf8")).hexdigest()
+
+
+def row_fingerprint(row: t.Dict[str, t.Any]) -> str:
+    """
+    Fingerprint of a dataset row, independent of the row position in the dataset.
+    """
+    return _hash(row)
+
+
+def metric_config_hash(metric: Metric) -> str:
+    """
+    Hash of the configuration of a metric: its class, prompts and the plain
+    settings like `max_retries` or `weights`. Models like the llm and
+    embeddings are not part of it.
+    """
+    from ragas.llms.prompt import Prompt
+
+    config: t.Dict[str, t.Any] = {"class": metric.__class__.__name__}
+    for f in dataclasses.fields(metric):
+        value = getattr(metric, f.name)
+        if isinstance(value, Prompt):
+            config[f.name] = value.dict()
+        elif isinstance(value, (str, int, float, bool, list, tuple, dict)):
+            config[f.name] = value
+    return _hash(config)
+
+
+@dataclass
+class CheckpointStore:
+    """
+    Append-only JSONL file of the scores computed so far. Every finished
+    (row, metric) job is written as soon as it completes so that an evaluation
+    that was interrupted can be resumed without re-computing them.
+
+    Scores that are NaN are not saved so that they are retried on the next run.
+
+    Attributes
+    ----------
+    path: str
+        Path to the JSONL file, created if it does not exist.
+    """
+
+    path: str
+    _scores: t.Dict[CheckpointKey, t.Any] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf8") as f:
+            for line_no, line in enumerate(f):
+                try:
+                    record = json.loads(line)
+                    key = (record["row"], record["metric"], record["config"])
+                    self._scores[key] = record["score"]
+                except (ValueError, KeyError):
+                    # most likely a line that was cut short when the run died
+                    logger.warning(
+                        "Skipping invalid line %s in checkpoint %s", line_no, self.path
+                    )
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, key: CheckpointKey) -> bool:
+        return key in self._scores
+
+    def get(self, key: CheckpointKey) -> t.Any:
+        return self._scores[key]
+
+    def save(self, key: CheckpointKey, score: t.Any):
+        if is_nan(score):
+            return
+        if isinstance(score, np.generic):
+            # numpy scalars are not JSON serializable
+            score = score.item()
+
+        row, metric, config = key
+        record = {"row": row, "metric": metric, "config": config, "score": score}
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with open(self.path, "a", encoding="utf8") as f:
+            f.write(json.dumps(record) + "\n")
+        self._scores[key] = score
+
+    def wrap(self, callable: t.Callable, key: CheckpointKey) -> t.Callable:
+        """
+        Wrap an async callable so that its result is saved under `key`, or
+        return the saved result right away if it is already in the store.
+        """
+
+        async def checkpointed_callable_async(*args, **kwargs):
+            if key in self:
+                return self.get(key)
+            score = await callable(*args, **kwargs)
+            self.save(key, score)
+            return score
+
+        return checkpointed_callable_async
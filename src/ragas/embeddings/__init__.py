@@ -1,13 +1,25 @@
 from ragas.embeddings.base import (
     BaseRagasEmbeddings,
+    BatchingEmbeddingsWrapper,
+    CachedEmbeddingsWrapper,
     HuggingfaceEmbeddings,
     LangchainEmbeddingsWrapper,
     embedding_factory,
 )
+from ragas.embeddings.cache import (
+    DiskEmbeddingCache,
+    EmbeddingCache,
+    InMemoryEmbeddingCache,
+)
 
 __all__ = [
     "HuggingfaceEmbeddings",
     "BaseRagasEmbeddings",
     "LangchainEmbeddingsWrapper",
+    "CachedEmbeddingsWrapper",
+    "BatchingEmbeddingsWrapper",
+    "EmbeddingCache",
+    "InMemoryEmbeddingCache",
+    "DiskEmbeddingCache",
     "embedding_factory",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import typing as t
 from abc import ABC
 from dataclasses import field
@@ -11,7 +12,15 @@ from langchain_core.embeddings import Embeddings
 from langchain_openai.embeddings import OpenAIEmbeddings
 from pydantic.dataclasses import dataclass
 
+from ragas.async_utils import MicroBatcher
+from ragas.embeddings.cache import (
+    EmbeddingCache,
+    InMemoryEmbeddingCache,
+    get_embedding_cache_key,
+)
+from ragas.rate_limiter import estimate_tokens
 from ragas.run_config import RunConfig, add_async_retry, add_retry
+from ragas.utils import get_model_identity
 
 DEFAULT_MODEL_NAME = "BAAI/bge-small-en-v1.5"
 
@@ -28,19 +37,40 @@ class BaseRagasEmbeddings(Embeddings, ABC):
     ) -> t.List[t.List[float]]:
         if is_async:
             aembed_documents_with_retry = add_async_retry(
-                self.aembed_documents, self.run_config
+                self._aembed_documents_with_limits, self.run_config
             )
             return await aembed_documents_with_retry(texts)
         else:
             loop = asyncio.get_event_loop()
             embed_documents_with_retry = add_retry(
-                self.embed_documents, self.run_config
+                self._embed_documents_with_limits, self.run_config
             )
             return await loop.run_in_executor(None, embed_documents_with_retry, texts)
 
+    async def _aembed_documents_with_limits(
+        self, texts: List[str]
+    ) -> t.List[t.List[float]]:
+        rate_limiter = self.run_config.get_rate_limiter(self.get_model_identity())
+        if rate_limiter is not None:
+            await rate_limiter.aacquire(sum(estimate_tokens(text) for text in texts))
+        return await self.aembed_documents(texts)
+
+    def _embed_documents_with_limits(self, texts: List[str]) -> t.List[t.List[float]]:
+        rate_limiter = self.run_config.get_rate_limiter(self.get_model_identity())
+        if rate_limiter is not None:
+            rate_limiter.acquire(sum(estimate_tokens(text) for text in texts))
+        return self.embed_documents(texts)
+
     def set_run_config(self, run_config: RunConfig):
         self.run_config = run_config
 
+    def get_model_identity(self) -> str:
+        """
+        Return a string that identifies the model, used for caching. Wrappers
+        should return the identity of the model they wrap.
+        """
+        return get_model_identity(self)
+
 
 class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
     def __init__(
@@ -63,6 +93,9 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
     async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
         return await self.embeddings.aembed_documents(texts)
 
+    def get_model_identity(self) -> str:
+        return get_model_identity(self.embeddings)
+
     def set_run_config(self, run_config: RunConfig):
         self.run_config = run_config
 
@@ -152,13 +185,186 @@ class HuggingfaceEmbeddings(BaseRagasEmbeddings):
         assert isinstance(predictions, Tensor)
         return predictions.tolist()
 
+    def get_model_identity(self) -> str:
+        params = {
+            "model_name": self.model_name,
+            "model_kwargs": self.model_kwargs,
+            "encode_kwargs": self.encode_kwargs,
+        }
+        dumped = json.dumps(params, sort_keys=True, default=str)
+        return f"{self.__class__.__name__}:{dumped}"
+
+
+class CachedEmbeddingsWrapper(BaseRagasEmbeddings):
+    """
+    Wraps another BaseRagasEmbeddings and only embeds the texts that are not in
+    the cache yet. Texts are looked up by the hash of their content and the model
+    identity, so a persistent cache like `DiskEmbeddingCache` can be shared across
+    runs and models.
+    """
+
+    def __init__(
+        self,
+        embeddings: BaseRagasEmbeddings,
+        cache: t.Optional[EmbeddingCache] = None,
+        run_config: t.Optional[RunConfig] = None,
+    ):
+        self.embeddings = embeddings
+        self.cache = cache if cache is not None else InMemoryEmbeddingCache()
+        if run_config is None:
+            run_config = RunConfig()
+        self.set_run_config(run_config)
+
+    def _split_cached(
+        self, texts: List[str]
+    ) -> t.Tuple[t.List[str], t.List[t.Optional[t.List[float]]]]:
+        model = self.get_model_identity()
+        keys = [get_embedding_cache_key(text, model) for text in texts]
+        return keys, self.cache.get_many(keys)
+
+    def _merge_cached(
+        self,
+        keys: t.List[str],
+        embeddings: t.List[t.Optional[t.List[float]]],
+        missing: t.List[int],
+        new_embeddings: t.List[t.List[float]],
+    ) -> List[List[float]]:
+        self.cache.set_many([keys[i] for i in missing], new_embeddings)
+        for i, embedding in zip(missing, new_embeddings):
+            embeddings[i] = embedding
+        return t.cast(List[List[float]], embeddings)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, embeddings = self._split_cached(texts)
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        new_embeddings = (
+            self.embeddings.embed_documents([texts[i] for i in missing])
+            if missing
+            else []
+        )
+        return self._merge_cached(keys, embeddings, missing, new_embeddings)
+
+    async def embed_texts(
+        self, texts: List[str], is_async: bool = True
+    ) -> t.List[t.List[float]]:
+        keys, embeddings = self._split_cached(texts)
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        # retries and rate limits only apply to the texts that are not cached
+        new_embeddings = (
+            await self.embeddings.embed_texts(
+                [texts[i] for i in missing], is_async=is_async
+            )
+            if missing
+            else []
+        )
+        return self._merge_cached(keys, embeddings, missing, new_embeddings)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        embeddings = await self.aembed_documents([text])
+        return embeddings[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, embeddings = self._split_cached(texts)
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        new_embeddings = (
+            await self.embeddings.aembed_documents([texts[i] for i in missing])
+            if missing
+            else []
+        )
+        return self._merge_cached(keys, embeddings, missing, new_embeddings)
+
+    def get_model_identity(self) -> str:
+        return self.embeddings.get_model_identity()
+
+    def set_run_config(self, run_config: RunConfig):
+        self.run_config = run_config
+        self.embeddings.set_run_config(run_config)
+
+
+class BatchingEmbeddingsWrapper(BaseRagasEmbeddings):
+    """
+    Wraps another BaseRagasEmbeddings and batches the `embed_text` and
+    `embed_texts` calls made concurrently by different coroutines. Texts are
+    collected for up to `batch_timeout` seconds or until `batch_size` texts are
+    waiting, then embedded with a single `aembed_documents` call and the vectors
+    are handed back to each caller.
+
+    Attributes
+    ----------
+    batch_size: int
+        Maximum number of texts sent in one request.
+    batch_timeout: float
+        Seconds to wait for more texts before sending a batch that is not full.
+    """
+
+    def __init__(
+        self,
+        embeddings: BaseRagasEmbeddings,
+        batch_size: int = 64,
+        batch_timeout: float = 0.01,
+        run_config: t.Optional[RunConfig] = None,
+    ):
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self._batcher = MicroBatcher(self._embed_batch, batch_size, batch_timeout)
+        if run_config is None:
+            run_config = RunConfig()
+        self.set_run_config(run_config)
+
+    async def embed_texts(
+        self, texts: List[str], is_async: bool = True
+    ) -> t.List[t.List[float]]:
+        if not is_async:
+            return await super().embed_texts(texts, is_async=False)
+
+        futures = [self._batcher.submit(text) for text in texts]
+        return list(await asyncio.gather(*futures))
+
+    async def _embed_batch(
+        self, key: t.Hashable, texts: t.List[str]
+    ) -> t.List[t.List[float]]:
+        # the same text requested by several callers is only embedded once
+        unique_texts = list(dict.fromkeys(texts))
+        # retries and rate limits are handled by the wrapped embeddings
+        embeddings = await self.embeddings.embed_texts(unique_texts)
+        text_embeddings = dict(zip(unique_texts, embeddings))
+        return [text_embeddings[text] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.embeddings.aembed_query(text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def get_model_identity(self) -> str:
+        return self.embeddings.get_model_identity()
+
+    def set_run_config(self, run_config: RunConfig):
+        self.run_config = run_config
+        self.embeddings.set_run_config(run_config)
+
 
 def embedding_factory(
-    model: str = "text-embedding-ada-002", run_config: t.Optional[RunConfig] = None
+    model: str = "text-embedding-ada-002",
+    run_config: t.Optional[RunConfig] = None,
+    cache: t.Optional[EmbeddingCache] = None,
 ) -> BaseRagasEmbeddings:
     openai_embeddings = OpenAIEmbeddings(model=model)
     if run_config is not None:
         openai_embeddings.request_timeout = run_config.timeout
     else:
         run_config = RunConfig()
-    return LangchainEmbeddingsWrapper(openai_embeddings, run_config=run_config)
+    embeddings = LangchainEmbeddingsWrapper(openai_embeddings, run_config=run_config)
+    if cache is not None:
+        return CachedEmbeddingsWrapper(embeddings, cache=cache, run_config=run_config)
+    return embeddings
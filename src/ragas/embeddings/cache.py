@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import typing as t
+from abc import ABC, abstractmethod
+
+import numpy as np
+import numpy.typing as npt
+
+from ragas.utils import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "embedding_cache"
+
+
+def get_embedding_cache_key(text: str, model: str) -> str:
+    return hashlib.sha256(f"{model}\0{text}".encode("utf8")).hexdigest()
+
+
+class EmbeddingCache(ABC):
+    """
+    Cache of embedding vectors keyed by the hash of the model and the text,
+    created with `get_embedding_cache_key`.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _get_many(self, keys: t.List[str]) -> t.List[t.Optional[t.List[float]]]: ...
+
+    @abstractmethod
+    def set_many(self, keys: t.List[str], embeddings: t.List[t.List[float]]): ...
+
+    def get_many(self, keys: t.List[str]) -> t.List[t.Optional[t.List[float]]]:
+        embeddings = self._get_many(keys)
+        misses = sum(1 for e in embeddings if e is None)
+        self.misses += misses
+        self.hits += len(embeddings) - misses
+        return embeddings
+
+    def stats(self) -> t.Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    def __init__(self):
+        super().__init__()
+        self._cache: t.Dict[str, t.List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _get_many(self, keys: t.List[str]) -> t.List[t.Optional[t.List[float]]]:
+        with self._lock:
+            return [self._cache.get(key) for key in keys]
+
+    def set_many(self, keys: t.List[str], embeddings: t.List[t.List[float]]):
+        with self._lock:
+            self._cache.update(zip(keys, embeddings))
+
+
+class DiskEmbeddingCache(EmbeddingCache):
+    """
+    Embeddings stored on disk as float32 matrices that are memory-mapped for
+    reads, so opening a large cache does not load every vector into memory.
+
+    The directory holds a `vectors-<dim>.f32` file with the rows of the matrix
+    of each embedding dimension, and `index.sqlite` that maps every key to its
+    dimension and row. New rows are appended while holding the SQLite write
+    lock, so several caches, in one process or in several, can share the
+    directory.
+    """
+
+    def __init__(self, path: t.Optional[str] = None):
+        super().__init__()
+        self.path = path or os.path.join(get_cache_dir(), DEFAULT_CACHE_DIR)
+        os.makedirs(self.path, exist_ok=True)
+        # transactions are handled explicitly, see `set_many`
+        self._conn = sqlite3.connect(
+            os.path.join(self.path, "index.sqlite"),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=60,
+        )
+        self._lock = threading.Lock()
+        self._vectors: t.Dict[int, npt.NDArray[np.float32]] = {}
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings"
+                " (key TEXT PRIMARY KEY, dim INTEGER, row INTEGER)"
+            )
+
+    def _vectors_path(self, dim: int) -> str:
+        return os.path.join(self.path, f"vectors-{dim}.f32")
+
+    def _matrix(self, dim: int, num_rows: int) -> npt.NDArray[np.float32]:
+        """
+        The memory-mapped matrix of dimension `dim` with at least `num_rows`
+        rows. The file is only mapped again when rows past the end of the
+        current mapping are needed.
+        """
+        vectors = self._vectors.get(dim)
+        if vectors is None or len(vectors) < num_rows:
+            path = self._vectors_path(dim)
+            vectors = np.memmap(
+                path,
+                dtype=np.float32,
+                mode="r",
+                shape=(os.path.getsize(path) // (4 * dim), dim),
+            )
+            self._vectors[dim] = vectors
+        return vectors
+
+    def _find(self, keys: t.Sequence[str]) -> t.Dict[str, t.Tuple[int, int]]:
+        found: t.Dict[str, t.Tuple[int, int]] = {}
+        # in chunks to stay under the SQLite limit of query parameters
+        chunk_size = 500
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i : i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                (key, (dim, row))
+                for key, dim, row in self._conn.execute(
+                    f"SELECT key, dim, row FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                )
+            )
+        return found
+
+    def _get_many(self, keys: t.List[str]) -> t.List[t.Optional[t.List[float]]]:
+        with self._lock:
+            found = self._find(keys)
+            embeddings: t.List[t.Optional[t.List[float]]] = []
+            for key in keys:
+                if key not in found:
+                    embeddings.append(None)
+                    continue
+                dim, row = found[key]
+                embeddings.append(self._matrix(dim, row + 1)[row].tolist())
+            return embeddings
+
+    def set_many(self, keys: t.List[str], embeddings: t.List[t.List[float]]):
+        if not keys:
+            return
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(keys), -1)
+        dim = int(vectors.shape[1])
+        row_size = 4 * dim
+        with self._lock:
+            # the write lock of the database serializes the appends of every
+            # cache that uses this directory
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                found = self._find(keys)
+                new = {key: i for i, key in enumerate(keys) if key not in found}
+                if new:
+                    (num_rows,) = self._conn.execute(
+                        "SELECT COALESCE(MAX(row) + 1, 0) FROM embeddings WHERE dim = ?",
+                        (dim,),
+                    ).fetchone()
+                    with open(self._vectors_path(dim), "ab") as f:
+                        if f.tell() != num_rows * row_size:
+                            # rows of a writer that died before committing
+                            logger.warning(
+                                "Dropping incomplete rows from embedding cache %s",
+                                self.path,
+                            )
+                            f.truncate(num_rows * row_size)
+                        f.write(vectors[list(new.values())].tobytes())
+                    self._conn.executemany(
+                        "INSERT INTO embeddings (key, dim, row) VALUES (?, ?, ?)",
+                        [(key, dim, num_rows + i) for i, key in enumerate(new)],
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
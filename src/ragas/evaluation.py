@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import typing as t
 from dataclasses import dataclass, field
 
@@ -10,13 +11,14 @@ from langchain_core.language_models import BaseLanguageModel as LangchainLLM
 
 from ragas._analytics import EvaluationEvent, track
 from ragas.callbacks import new_group
+from ragas.checkpoint import CheckpointStore, metric_config_hash, row_fingerprint
 from ragas.embeddings.base import (
     BaseRagasEmbeddings,
     LangchainEmbeddingsWrapper,
     embedding_factory,
 )
 from ragas.exceptions import ExceptionInRunner
-from ragas.executor import Executor
+from ragas.executor import Executor, run_on_shared_loop
 from ragas.llms import llm_factory
 from ragas.llms.base import BaseRagasLLM, LangchainLLMWrapper
 from ragas.metrics._answer_correctness import AnswerCorrectness
@@ -24,6 +26,7 @@ from ragas.metrics.base import (
     Metric,
     MetricWithEmbeddings,
     MetricWithLLM,
+    RowArtifacts,
     is_reproducable,
 )
 from ragas.metrics.critique import AspectCritique
@@ -41,8 +44,10 @@ from ragas.validation import (
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
 
+logger = logging.getLogger(__name__)
 
-def evaluate(
+
+async def aevaluate(
     dataset: Dataset,
     metrics: list[Metric] | None = None,
     llm: t.Optional[BaseRagasLLM | LangchainLLM] = None,
@@ -53,9 +58,12 @@ def evaluate(
     run_config: t.Optional[RunConfig] = None,
     raise_exceptions: bool = True,
     column_map: t.Optional[t.Dict[str, str]] = None,
+    checkpoint: t.Optional[str | CheckpointStore] = None,
 ) -> Result:
     """
-    Run the evaluation on the dataset with different metrics
+    Run the evaluation on the dataset with different metrics. The metric jobs
+    are scheduled on the running event loop, so it can be awaited from async
+    code like a web server and several evaluations can run at once.
 
     Parameters
     ----------
@@ -98,6 +106,12 @@ def evaluate(
         the dataset are different from the default ones then you can provide the
         mapping as a dictionary here. Example: If the dataset column name is contexts_v1,
         column_map can be given as {"contexts":"contexts_v1"}
+    checkpoint : str | CheckpointStore, optional
+        Path to a JSONL checkpoint file (or a `CheckpointStore`). Every score is
+        written to it as soon as it is computed and scores already in it are not
+        computed again, so an interrupted evaluation can be resumed by running it
+        again with the same checkpoint. Scores are matched on the content of the
+        row, the metric name and the metric configuration.
 
     Returns
     -------
@@ -111,6 +125,99 @@ def evaluate(
         if validation fails because the columns required for the metrics are missing or
         if the columns are of the wrong format.
 
+    Examples
+    --------
+    the basic usage is as follows:
+    ```
+    from ragas import aevaluate
+
+    >>> dataset
+    Dataset({
+        features: ['question', 'ground_truth', 'answer', 'contexts'],
+        num_rows: 30
+    })
+
+    >>> result = await aevaluate(dataset)
+    >>> print(result)
+    {'context_precision': 0.817,
+    'faithfulness': 0.892,
+    'answer_relevancy': 0.874}
+    ```
+    """
+    column_map = column_map or {}
+    callbacks = callbacks or []
+    # default run_config
+    run_config = run_config or RunConfig()
+
+    dataset, metrics = _prepare_dataset(dataset, metrics, column_map)
+    binary_metrics, reset_metrics = _init_metrics(
+        metrics, llm, embeddings, run_config, in_ci
+    )
+    executor, (evaluation_rm, evaluation_group_cm), row_run_managers = _submit_rows(
+        dataset, metrics, callbacks, is_async, raise_exceptions, run_config, checkpoint
+    )
+
+    scores = []
+    try:
+        # get the results
+        results = await executor.aresults()
+        if results == []:
+            raise ExceptionInRunner()
+
+        # convert results to dataset_like
+        for i, _ in enumerate(dataset):
+            s = {}
+            for j, m in enumerate(metrics):
+                s[m.name] = results[len(metrics) * i + j]
+            scores.append(s)
+            # close the row chain
+            row_rm, row_group_cm = row_run_managers[i]
+            if not row_group_cm.ended:
+                row_rm.on_chain_end(s)
+
+    # run evaluation task
+    except Exception as e:
+        if not evaluation_group_cm.ended:
+            evaluation_rm.on_chain_error(e)
+
+        raise e
+    else:
+        failures, executor_stats = _run_report(executor)
+        result = Result(
+            scores=Dataset.from_list(scores),
+            dataset=dataset,
+            binary_columns=binary_metrics,
+            failures=failures,
+            executor_stats=executor_stats,
+        )
+        if not evaluation_group_cm.ended:
+            evaluation_rm.on_chain_end(result)
+    finally:
+        reset_metrics()
+
+    _track_evaluation(metrics, dataset.shape[0], in_ci)
+    return result
+
+
+def evaluate(
+    dataset: Dataset,
+    metrics: list[Metric] | None = None,
+    llm: t.Optional[BaseRagasLLM | LangchainLLM] = None,
+    embeddings: t.Optional[BaseRagasEmbeddings | LangchainEmbeddings] = None,
+    callbacks: Callbacks = None,
+    in_ci: bool = False,
+    is_async: bool = True,
+    run_config: t.Optional[RunConfig] = None,
+    raise_exceptions: bool = True,
+    column_map: t.Optional[t.Dict[str, str]] = None,
+    checkpoint: t.Optional[str | CheckpointStore] = None,
+) -> Result:
+    """
+    Run the evaluation on the dataset with different metrics
+
+    Blocking version of `aevaluate`, the metric jobs run on the event loop shared
+    by all executors. Takes the same parameters as `aevaluate`.
+
     Examples
     --------
     the basic usage is as follows:
@@ -130,14 +237,111 @@ def evaluate(
     'answer_relevancy': 0.874}
     ```
     """
+    return run_on_shared_loop(
+        aevaluate(
+            dataset,
+            metrics=metrics,
+            llm=llm,
+            embeddings=embeddings,
+            callbacks=callbacks,
+            in_ci=in_ci,
+            is_async=is_async,
+            run_config=run_config,
+            raise_exceptions=raise_exceptions,
+            column_map=column_map,
+            checkpoint=checkpoint,
+        )
+    )
+
+
+def evaluate_stream(
+    dataset: Dataset,
+    metrics: list[Metric] | None = None,
+    llm: t.Optional[BaseRagasLLM | LangchainLLM] = None,
+    embeddings: t.Optional[BaseRagasEmbeddings | LangchainEmbeddings] = None,
+    callbacks: Callbacks = None,
+    in_ci: bool = False,
+    is_async: bool = True,
+    run_config: t.Optional[RunConfig] = None,
+    raise_exceptions: bool = True,
+    column_map: t.Optional[t.Dict[str, str]] = None,
+    checkpoint: t.Optional[str | CheckpointStore] = None,
+) -> t.Iterator[t.Tuple[int, str, t.Any]]:
+    """
+    Run the evaluation on the dataset like `evaluate` but yield the scores as soon
+    as they are computed instead of waiting for the whole dataset.
+
+    Takes the same parameters as `evaluate`.
+
+    Yields
+    ------
+    tuple[int, str, float]
+        `(row_index, metric_name, score)` in the order the jobs finish. Failed jobs
+        yield `np.nan` when `raise_exceptions` is False.
+
+    Examples
+    --------
+    ```
+    from ragas.evaluation import evaluate_stream
+
+    >>> for row_index, metric_name, score in evaluate_stream(dataset):
+    ...     print(row_index, metric_name, score)
+    3 faithfulness 1.0
+    0 context_recall 0.5
+    ```
+    """
     column_map = column_map or {}
     callbacks = callbacks or []
+    run_config = run_config or RunConfig()
+
+    dataset, metrics = _prepare_dataset(dataset, metrics, column_map)
+    _, reset_metrics = _init_metrics(metrics, llm, embeddings, run_config, in_ci)
+    executor, (evaluation_rm, evaluation_group_cm), row_run_managers = _submit_rows(
+        dataset, metrics, callbacks, is_async, raise_exceptions, run_config, checkpoint
+    )
 
+    # only rows that are still missing some metrics are kept around
+    pending_rows: t.Dict[int, t.Dict[str, t.Any]] = {}
+    try:
+        for index, score in executor.iter_results():
+            row_index, metric_index = divmod(index, len(metrics))
+            metric_name = metrics[metric_index].name
+            row_scores = pending_rows.setdefault(row_index, {})
+            row_scores[metric_name] = score
+            if len(row_scores) == len(metrics):
+                # close the row chain
+                del pending_rows[row_index]
+                row_rm, row_group_cm = row_run_managers[row_index]
+                if not row_group_cm.ended:
+                    row_rm.on_chain_end(row_scores)
+
+            yield row_index, metric_name, score
+    except Exception as e:
+        if not evaluation_group_cm.ended:
+            evaluation_rm.on_chain_error(e)
+
+        raise e
+    else:
+        _run_report(executor)
+        if not evaluation_group_cm.ended:
+            evaluation_rm.on_chain_end({})
+    finally:
+        reset_metrics()
+
+    _track_evaluation(metrics, dataset.shape[0], in_ci)
+
+
+def _prepare_dataset(
+    dataset: Dataset,
+    metrics: list[Metric] | None,
+    column_map: t.Dict[str, str],
+) -> t.Tuple[Dataset, list[Metric]]:
+    """
+    Remap and validate the dataset and pick the default metrics if none are given.
+    """
     if dataset is None:
         raise ValueError("Provide dataset!")
 
-    # default run_config
-    run_config = run_config or RunConfig()
     # default metrics
     if metrics is None:
         from ragas.metrics import (
@@ -156,6 +360,22 @@ def evaluate(
     validate_evaluation_modes(dataset, metrics)
     validate_column_dtypes(dataset)
 
+    return dataset, metrics
+
+
+def _init_metrics(
+    metrics: list[Metric],
+    llm: t.Optional[BaseRagasLLM | LangchainLLM],
+    embeddings: t.Optional[BaseRagasEmbeddings | LangchainEmbeddings],
+    run_config: RunConfig,
+    in_ci: bool,
+) -> t.Tuple[t.List[str], t.Callable[[], None]]:
+    """
+    Set the llm and embeddings on the metrics that need them and init the models.
+
+    Returns the names of the binary metrics and a function that resets the metrics
+    to the state they were in before.
+    """
     # set the llm and embeddings
     if isinstance(llm, LangchainLLM):
         llm = LangchainLLMWrapper(llm, run_config=run_config)
@@ -197,6 +417,48 @@ def evaluate(
         # init all the models
         metric.init(run_config)
 
+    def reset_metrics():
+        # reset llms and embeddings if changed
+        for i in llm_changed:
+            t.cast(MetricWithLLM, metrics[i]).llm = None
+        for i in embeddings_changed:
+            t.cast(MetricWithEmbeddings, metrics[i]).embeddings = None
+        if answer_correctness_is_set != -1:
+            t.cast(
+                AnswerCorrectness, metrics[answer_correctness_is_set]
+            ).answer_similarity = None
+
+        for i in reproducable_metrics:
+            metrics[i].reproducibility = 1  # type: ignore
+
+    return binary_metrics, reset_metrics
+
+
+def _submit_rows(
+    dataset: Dataset,
+    metrics: list[Metric],
+    callbacks: Callbacks,
+    is_async: bool,
+    raise_exceptions: bool,
+    run_config: RunConfig,
+    checkpoint: t.Optional[str | CheckpointStore] = None,
+) -> t.Tuple[Executor, t.Tuple[t.Any, t.Any], t.List[t.Tuple[t.Any, t.Any]]]:
+    """
+    Submit a job for every (row, metric) pair, job `i` scores row
+    `i // len(metrics)` with metric `i % len(metrics)`. With a checkpoint the
+    jobs return the saved score if there is one and save the new score otherwise.
+    The jobs of a row share their intermediate artifacts through `RowArtifacts`.
+
+    Returns the executor, the evaluation chain and the chain of each row.
+    """
+    if isinstance(checkpoint, str):
+        checkpoint = CheckpointStore(path=checkpoint)
+    config_hashes = (
+        [metric_config_hash(metric) for metric in metrics]
+        if checkpoint is not None
+        else []
+    )
+
     executor = Executor(
         desc="Evaluating",
         keep_progress_bar=True,
@@ -217,59 +479,54 @@ def evaluate(
             is_async=is_async,
         )
         row_run_managers.append((row_rm, row_group_cm))
-        [
+        fingerprint = row_fingerprint(row) if checkpoint is not None else ""
+        artifacts = RowArtifacts()
+        for j, metric in enumerate(metrics):
+            score_fn = metric.ascore
+            if checkpoint is not None:
+                score_fn = checkpoint.wrap(
+                    score_fn, (fingerprint, metric.name, config_hashes[j])
+                )
+            # outermost so that the jobs that find their score in the checkpoint
+            # are counted as finished too
+            score_fn = artifacts.wrap(score_fn)
             executor.submit(
-                metric.ascore, row, row_group_cm, is_async, name=f"{metric.name}-{i}"
+                score_fn, row, row_group_cm, is_async, name=f"{metric.name}-{i}"
             )
-            for metric in metrics
-        ]
 
-    scores = []
-    try:
-        # get the results
-        results = executor.results()
-        if results == []:
-            raise ExceptionInRunner()
+    return executor, (evaluation_rm, evaluation_group_cm), row_run_managers
 
-        # convert results to dataset_like
-        for i, _ in enumerate(dataset):
-            s = {}
-            for j, m in enumerate(metrics):
-                s[m.name] = results[len(metrics) * i + j]
-            scores.append(s)
-            # close the row chain
-            row_rm, row_group_cm = row_run_managers[i]
-            if not row_group_cm.ended:
-                row_rm.on_chain_end(s)
 
-    # run evaluation task
-    except Exception as e:
-        if not evaluation_group_cm.ended:
-            evaluation_rm.on_chain_error(e)
-
-        raise e
-    else:
-        result = Result(
-            scores=Dataset.from_list(scores),
-            dataset=dataset,
-            binary_columns=binary_metrics,
+def _run_report(
+    executor: Executor,
+) -> t.Tuple[t.Dict[str, str], t.Dict[str, t.Any]]:
+    """
+    Log a summary of the run and return the reason of every job that was scored
+    NaN, by job name, and the stats of the adaptive concurrency controller.
+    """
+    failures = {
+        executor.jobs[index][1]: reason for index, reason in executor.failures.items()
+    }
+    if failures:
+        # the first few are enough to tell what went wrong
+        examples = "; ".join(
+            f"{name}: {reason}" for name, reason in list(failures.items())[:5]
         )
-        if not evaluation_group_cm.ended:
-            evaluation_rm.on_chain_end(result)
-    finally:
-        # reset llms and embeddings if changed
-        for i in llm_changed:
-            t.cast(MetricWithLLM, metrics[i]).llm = None
-        for i in embeddings_changed:
-            t.cast(MetricWithEmbeddings, metrics[i]).embeddings = None
-        if answer_correctness_is_set != -1:
-            t.cast(
-                AnswerCorrectness, metrics[answer_correctness_is_set]
-            ).answer_similarity = None
+        logger.warning(
+            "%d of %d jobs failed and were scored NaN, e.g. %s",
+            len(failures),
+            len(executor.jobs),
+            examples,
+        )
+    executor_stats = (
+        executor.concurrency.stats() if executor.concurrency is not None else {}
+    )
+    if executor_stats:
+        logger.info("Adaptive concurrency: %s", executor_stats)
+    return failures, executor_stats
 
-        for i in reproducable_metrics:
-            metrics[i].reproducibility = 1  # type: ignore
 
+def _track_evaluation(metrics: list[Metric], num_rows: int, in_ci: bool):
     # log the evaluation event
     metrics_names = [m.name for m in metrics]
     metric_lang = [get_feature_language(m) for m in metrics]
@@ -279,12 +536,11 @@ def evaluate(
             event_type="evaluation",
             metrics=metrics_names,
             evaluation_mode="",
-            num_rows=dataset.shape[0],
+            num_rows=num_rows,
             language=metric_lang[0] if len(metric_lang) > 0 else "",
             in_ci=in_ci,
         )
     )
-    return result
 
 
 @dataclass
@@ -292,6 +548,10 @@ class Result(dict):
     scores: Dataset
     dataset: t.Optional[Dataset] = None
     binary_columns: t.List[str] = field(default_factory=list)
+    # reason of every score that is NaN because its job failed, by job name
+    failures: t.Dict[str, str] = field(default_factory=dict)
+    # stats of the adaptive concurrency controller, if it was used
+    executor_stats: t.Dict[str, t.Any] = field(default_factory=dict)
 
     def __post_init__(self):
         values = []
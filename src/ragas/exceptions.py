@@ -27,6 +27,16 @@ class MaxRetriesExceeded(RagasException):
         super().__init__(msg)
 
 
+class JobTimeout(RagasException):
+    """
+    Exception raised when a job of the executor takes longer than its deadline.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(f"Job did not finish within {timeout} seconds.")
+
+
 class ExceptionInRunner(RagasException):
     """
     Exception raised when an exception is raised in the executor.
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import logging
-import sys
+import queue
 import threading
+import time
 import typing as t
+from collections import deque
 from dataclasses import dataclass, field
+from functools import partial
 
 import numpy as np
 from tqdm.auto import tqdm
 
-from ragas.exceptions import MaxRetriesExceeded
+from ragas.exceptions import ExceptionInRunner, JobTimeout, MaxRetriesExceeded
 from ragas.run_config import RunConfig
 
 logger = logging.getLogger(__name__)
@@ -25,78 +29,377 @@ def runner_exception_hook(args: threading.ExceptHookArgs):
 # threading.excepthook = runner_exception_hook
 
 
-def as_completed(loop, coros, max_workers):
-    loop_arg_dict = {"loop": loop} if sys.version_info[:2] < (3, 10) else {}
-    if max_workers == -1:
-        return asyncio.as_completed(coros, **loop_arg_dict)
+def is_overload_error(exception: BaseException) -> bool:
+    """Whether the exception means the provider is overloaded."""
+    if isinstance(exception, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    name = exception.__class__.__name__.lower()
+    return "ratelimit" in name or "timeout" in name
 
-    # loop argument is removed since Python 3.10
-    semaphore = asyncio.Semaphore(max_workers, **loop_arg_dict)
 
-    async def sema_coro(coro):
-        async with semaphore:
-            return await coro
+@dataclass
+class AdaptiveConcurrency:
+    """
+    AIMD (additive increase, multiplicative decrease) limit on the number of
+    jobs running at once.
+
+    While the jobs are healthy and all the slots are in use the limit grows by
+    about one every `limit` jobs. It is multiplied by `decrease_factor` when a
+    job fails with a timeout or rate limit error, or when the median latency of
+    the recent jobs is more than `latency_tolerance` times the best median seen
+    so far (a sign that requests are being throttled and retried). Latencies also
+    change with the workload, so after such a decrease the best median is
+    measured again instead of ratcheting the limit down to `min_limit`.
+
+    Attributes
+    ----------
+    limit: float
+        The current limit, use `current_limit` for the number of slots.
+    min_limit: int
+        The limit never goes below this.
+    max_limit: int
+        The limit never goes above this.
+    limit_changes: list[tuple[float, int, int, str]]
+        (time, old limit, new limit, reason) for every change of `current_limit`.
+    """
+
+    limit: float = 16
+    min_limit: int = 1
+    max_limit: int = 256
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+    window: int = 50
+    in_flight: int = 0
+    latencies: t.Deque[float] = field(default_factory=deque, repr=False)
+    limit_changes: t.List[t.Tuple[float, int, int, str]] = field(
+        default_factory=list, repr=False
+    )
+    _best_median_latency: t.Optional[float] = field(default=None, repr=False)
+    _completed: int = field(default=0, repr=False)
+    _decreased_at: t.Optional[int] = field(default=None, repr=False)
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, min(self.max_limit, int(self.limit)))
+
+    def _set_limit(self, limit: float, reason: str):
+        old = self.current_limit
+        self.limit = max(self.min_limit, min(self.max_limit, limit))
+        if self.current_limit != old:
+            logger.debug(
+                "concurrency limit %s -> %s (%s)", old, self.current_limit, reason
+            )
+            self.limit_changes.append((time.time(), old, self.current_limit, reason))
+
+    def _decrease(self, reason: str):
+        # decrease at most once per round of jobs, the jobs that were already
+        # running when the limit was lowered will report the same problem
+        if (
+            self._decreased_at is not None
+            and self._completed - self._decreased_at < self.current_limit
+        ):
+            return
+        self._decreased_at = self._completed
+        self._set_limit(self.limit * self.decrease_factor, reason)
+
+    def on_job_done(self, latency: float, exception: t.Optional[BaseException]):
+        was_saturated = self.in_flight >= self.current_limit
+        self.in_flight -= 1
+        self._completed += 1
+
+        if exception is not None:
+            if is_overload_error(exception):
+                self._decrease(exception.__class__.__name__)
+            return
 
-    sema_coros = [sema_coro(c) for c in coros]
-    return asyncio.as_completed(sema_coros, **loop_arg_dict)
+        self.latencies.append(latency)
+        if len(self.latencies) > self.window:
+            self.latencies.popleft()
+        if len(self.latencies) >= min(10, self.window):
+            median = float(np.median(self.latencies))
+            if self._best_median_latency is None or median < self._best_median_latency:
+                self._best_median_latency = median
+            elif median > self.latency_tolerance * self._best_median_latency:
+                self._decrease("latency")
+                self._best_median_latency = None
+                self.latencies.clear()
+                return
 
+        if was_saturated:
+            self._set_limit(self.limit + 1 / self.limit, "healthy")
+
+    def latency_percentiles(self) -> t.Dict[str, float]:
+        """p50, p90 and p99 latency in seconds of the recent jobs."""
+        if not self.latencies:
+            return {}
+        p50, p90, p99 = np.percentile(self.latencies, [50, 90, 99])
+        return {"p50": float(p50), "p90": float(p90), "p99": float(p99)}
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        return {
+            "limit": self.current_limit,
+            "in_flight": self.in_flight,
+            "latency": self.latency_percentiles(),
+            "limit_changes": len(self.limit_changes),
+        }
+
+
+async def as_completed(
+    jobs: t.Iterable[t.Callable[[], t.Awaitable]],
+    max_workers: int,
+    concurrency: t.Optional[AdaptiveConcurrency] = None,
+) -> t.AsyncGenerator[t.Tuple[int, asyncio.Future], None]:
+    """
+    Yield `(job_index, task)` for `jobs` as they finish.
+
+    Each job is a zero-argument callable that returns an awaitable. Jobs are only
+    turned into coroutines when a worker slot frees up, so at most `max_workers`
+    coroutines are alive at any time (-1 means no limit). If `concurrency` is
+    given its adaptive limit is used instead of `max_workers`.
+    """
+    indexed_jobs = enumerate(jobs)
+    pending: t.Dict[asyncio.Future, t.Tuple[int, float]] = {}
+
+    def has_free_slot() -> bool:
+        if concurrency is not None:
+            return len(pending) < concurrency.current_limit
+        return max_workers == -1 or len(pending) < max_workers
+
+    try:
+        while True:
+            while has_free_slot():
+                next_job = next(indexed_jobs, None)
+                if next_job is None:
+                    break
+                index, job = next_job
+                pending[asyncio.ensure_future(job())] = (index, time.monotonic())
+                if concurrency is not None:
+                    concurrency.in_flight += 1
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(
+                pending.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                index, started_at = pending.pop(future)
+                if concurrency is not None:
+                    concurrency.on_job_done(
+                        time.monotonic() - started_at,
+                        None if future.cancelled() else future.exception(),
+                    )
+                yield index, future
+    finally:
+        # cancel whatever is still running if the consumer stops early
+        for future in pending:
+            future.cancel()
 
-class Runner(threading.Thread):
+
+class _LoopThread(threading.Thread):
+    """Daemon thread running an event loop forever."""
+
+    def __init__(self):
+        super().__init__(name="ragas-event-loop", daemon=True)
+        self.loop = asyncio.new_event_loop()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join()
+        self.loop.close()
+
+
+_shared_loop_thread: t.Optional[_LoopThread] = None
+_shared_loop_lock = threading.Lock()
+
+
+def get_shared_loop_thread() -> _LoopThread:
+    """
+    The background thread whose event loop runs the jobs of every `Executor`.
+    It is started on first use and lives as long as the process, so that the
+    HTTP connection pools and other loop bound state of the models are reused
+    across runs.
+    """
+    global _shared_loop_thread
+    with _shared_loop_lock:
+        if _shared_loop_thread is None or not _shared_loop_thread.is_alive():
+            _shared_loop_thread = _LoopThread()
+            _shared_loop_thread.start()
+        return _shared_loop_thread
+
+
+def run_on_shared_loop(coroutine: t.Coroutine) -> t.Any:
+    """
+    Run a coroutine on the shared background loop and block until it is done.
+    Works whether or not an event loop is already running in the calling thread.
+    """
+    loop_thread = own_loop_thread = get_shared_loop_thread()
+    if threading.current_thread() is loop_thread:
+        # the shared loop is blocked by the caller, use a loop of our own
+        own_loop_thread = _LoopThread()
+        own_loop_thread.start()
+    future = asyncio.run_coroutine_threadsafe(coroutine, own_loop_thread.loop)
+    try:
+        return future.result()
+    finally:
+        if not future.done():
+            # interrupted while waiting, do not leave the coroutine running
+            future.cancel()
+        if own_loop_thread is not loop_thread:
+            own_loop_thread.close()
+
+
+class Runner:
     def __init__(
         self,
-        jobs: t.List[t.Tuple[t.Coroutine, str]],
+        jobs: t.List[t.Tuple[t.Callable[[], t.Awaitable], str]],
         desc: str,
         keep_progress_bar: bool = True,
         raise_exceptions: bool = True,
         run_config: t.Optional[RunConfig] = None,
+        on_result: t.Optional[t.Callable[[t.Tuple[int, t.Any]], None]] = None,
+        concurrency: t.Optional[AdaptiveConcurrency] = None,
     ):
-        super().__init__()
         self.jobs = jobs
         self.desc = desc
         self.keep_progress_bar = keep_progress_bar
         self.raise_exceptions = raise_exceptions
         self.run_config = run_config or RunConfig()
+        # called with every (index, result) pair as soon as the job finishes
+        self.on_result = on_result
+        # adaptive limit on the running jobs, `run_config.max_workers` if None
+        self.concurrency = concurrency
+        # reason of every job that ended up as NaN, by job index
+        self.failures: t.Dict[int, str] = {}
 
-        # create task
-        self.loop = asyncio.new_event_loop()
-        self.futures = as_completed(
-            loop=self.loop,
-            coros=[coro for coro, _ in self.jobs],
-            max_workers=self.run_config.max_workers,
-        )
+        self.results: t.Optional[t.List[t.Any]] = None
+        self._future: t.Optional[concurrent.futures.Future] = None
+        self._own_loop_thread: t.Optional[_LoopThread] = None
+
+    def _with_deadline(
+        self, job: t.Callable[[], t.Awaitable]
+    ) -> t.Callable[[], t.Awaitable]:
+        timeout = self.run_config.job_timeout
+        if timeout is None:
+            return job
+
+        async def job_with_deadline():
+            try:
+                return await asyncio.wait_for(job(), timeout)
+            except asyncio.TimeoutError as e:
+                raise JobTimeout(timeout) from e
+
+        return job_with_deadline
 
     async def _aresults(self) -> t.List[t.Any]:
         results = []
-        for future in tqdm(
-            self.futures,
+        futures = as_completed(
+            jobs=(self._with_deadline(job) for job, _ in self.jobs),
+            max_workers=self.run_config.max_workers,
+            concurrency=self.concurrency,
+        )
+        pbar = tqdm(
             desc=self.desc,
             total=len(self.jobs),
             # whether you want to keep the progress bar after completion
             leave=self.keep_progress_bar,
-        ):
-            r = (-1, np.nan)
-            try:
-                r = await future
-            except MaxRetriesExceeded as e:
-                logger.warning(f"max retries exceeded for {e.evolution}")
-            except Exception as e:
-                if self.raise_exceptions:
-                    raise e
+        )
+        try:
+            async for index, future in futures:
+                r = (index, np.nan)
+                try:
+                    r = future.result()
+                except MaxRetriesExceeded as e:
+                    logger.warning(f"max retries exceeded for {e.evolution}")
+                    self.failures[index] = e.message
+                except JobTimeout as e:
+                    # a single hung job should not fail the whole run
+                    logger.warning(f"{self.jobs[index][1]}: {e.message}")
+                    self.failures[index] = e.message
+                except Exception as e:
+                    if self.raise_exceptions:
+                        raise e
+                    else:
+                        logger.error(
+                            "Runner in Executor raised an exception", exc_info=True
+                        )
+                        self.failures[index] = repr(e)
+                if self.on_result is not None:
+                    # streamed results are not kept so that memory stays flat
+                    self.on_result(r)
                 else:
-                    logger.error(
-                        "Runner in Executor raised an exception", exc_info=True
-                    )
-            results.append(r)
+                    results.append(r)
+                pbar.update(1)
+        finally:
+            await futures.aclose()
+            pbar.close()
 
         return results
 
-    def run(self):
+    async def arun(self) -> t.List[t.Any]:
+        """
+        Run all the jobs on the running event loop and return the
+        `(index, result)` pairs in the order they finished. When `on_result` is
+        set the results are only passed to it and the list is empty.
+        """
         results = []
         try:
-            results = self.loop.run_until_complete(self._aresults())
+            results = await self._aresults()
         finally:
             self.results = results
-            self.loop.stop()
+        return results
+
+    async def _arun_in_background(self) -> t.List[t.Any]:
+        try:
+            return await self.arun()
+        except asyncio.CancelledError:
+            logger.debug("Runner in Executor was stopped before finishing")
+            return []
+
+    def start(self):
+        """
+        Start running the jobs in the background on the shared event loop.
+        """
+        loop_thread = get_shared_loop_thread()
+        if threading.current_thread() is loop_thread:
+            # a job running on the shared loop is blocking it while it waits for
+            # these jobs, they need a loop of their own to not deadlock
+            self._own_loop_thread = loop_thread = _LoopThread()
+            loop_thread.start()
+        self._future = asyncio.run_coroutine_threadsafe(
+            self._arun_in_background(), loop_thread.loop
+        )
+
+    def is_alive(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def join(self):
+        """
+        Wait for all the jobs to finish.
+        """
+        if self._future is None:
+            return
+        try:
+            concurrent.futures.wait([self._future])
+            if not self._future.cancelled() and self._future.exception() is not None:
+                logger.error(
+                    "Runner in Executor raised an exception",
+                    exc_info=self._future.exception(),
+                )
+        finally:
+            if self._own_loop_thread is not None and not self.is_alive():
+                self._own_loop_thread.close()
+                self._own_loop_thread = None
+
+    def stop(self):
+        """
+        Cancel all the running jobs, can be called from any thread.
+        """
+        if self._future is not None:
+            self._future.cancel()
 
 
 @dataclass
@@ -106,6 +409,28 @@ class Executor:
     jobs: t.List[t.Any] = field(default_factory=list, repr=False)
     raise_exceptions: bool = False
     run_config: t.Optional[RunConfig] = field(default_factory=RunConfig, repr=False)
+    concurrency: t.Optional[AdaptiveConcurrency] = field(
+        default=None, init=False, repr=False
+    )
+    # reason of every job that ended up as NaN in the last run, by job index
+    failures: t.Dict[int, str] = field(default_factory=dict, init=False, repr=False)
+
+    def _new_concurrency(self) -> t.Optional[AdaptiveConcurrency]:
+        """
+        The adaptive concurrency controller of the next run, None when
+        `run_config.adaptive_concurrency` is off. It is kept in `concurrency`
+        so that its metrics can be read during and after the run.
+        """
+        run_config = self.run_config or RunConfig()
+        if not run_config.adaptive_concurrency:
+            self.concurrency = None
+            return None
+        max_limit = run_config.max_adaptive_workers
+        initial = run_config.max_workers if run_config.max_workers > 0 else max_limit
+        self.concurrency = AdaptiveConcurrency(
+            limit=min(initial, max_limit), max_limit=max_limit
+        )
+        return self.concurrency
 
     def wrap_callable_with_index(self, callable: t.Callable, counter):
         async def wrapped_callable_async(*args, **kwargs):
@@ -116,22 +441,46 @@ class Executor:
     def submit(
         self, callable: t.Callable, *args, name: t.Optional[str] = None, **kwargs
     ):
+        """
+        Queue a job. The coroutine is only created once the runner has a free
+        worker slot for it.
+        """
         callable_with_index = self.wrap_callable_with_index(callable, len(self.jobs))
-        self.jobs.append((callable_with_index(*args, **kwargs), name))
+        self.jobs.append((partial(callable_with_index, *args, **kwargs), name))
 
-    def results(self) -> t.List[t.Any]:
-        executor_job = Runner(
+    def _new_runner(
+        self, on_result: t.Optional[t.Callable[[t.Tuple[int, t.Any]], None]] = None
+    ) -> Runner:
+        runner = Runner(
             jobs=self.jobs,
             desc=self.desc,
             keep_progress_bar=self.keep_progress_bar,
             raise_exceptions=self.raise_exceptions,
             run_config=self.run_config,
+            on_result=on_result,
+            concurrency=self._new_concurrency(),
         )
+        self.failures = runner.failures
+        return runner
+
+    async def aresults(self) -> t.List[t.Any]:
+        """
+        Same as `results()` but runs the jobs on the event loop of the caller
+        instead of the shared background loop.
+        """
+        results = await self._new_runner().arun()
+        sorted_results = sorted(results, key=lambda x: x[0])
+        return [r[1] for r in sorted_results]
+
+    def results(self) -> t.List[t.Any]:
+        executor_job = self._new_runner()
         executor_job.start()
         try:
             executor_job.join()
         finally:
-            ...
+            if executor_job.is_alive():
+                # interrupted while waiting, do not leave the jobs running
+                executor_job.stop()
 
         if executor_job.results is None:
             if self.raise_exceptions:
@@ -143,3 +492,31 @@ class Executor:
                 return []
         sorted_results = sorted(executor_job.results, key=lambda x: x[0])
         return [r[1] for r in sorted_results]
+
+    def iter_results(self) -> t.Iterator[t.Tuple[int, t.Any]]:
+        """
+        Yield `(job_index, result)` pairs in the order the jobs finish, instead of
+        waiting for all of them like `results()`. Failed jobs yield `np.nan` when
+        `raise_exceptions` is False.
+        """
+        result_queue: queue.Queue = queue.Queue()
+        executor_job = self._new_runner(on_result=result_queue.put)
+        executor_job.start()
+        num_results = 0
+        try:
+            while num_results < len(self.jobs):
+                try:
+                    r = result_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if not executor_job.is_alive() and result_queue.empty():
+                        break
+                    continue
+                num_results += 1
+                yield r
+        finally:
+            if executor_job.is_alive():
+                executor_job.stop()
+            executor_job.join()
+
+        if num_results < len(self.jobs):
+            raise ExceptionInRunner()
@@ -1,7 +1,11 @@
 from ragas.llms.base import BaseRagasLLM, LangchainLLMWrapper, llm_factory
+from ragas.llms.cache import InMemoryLLMCache, LLMCache, SqliteLLMCache
 
 __all__ = [
     "BaseRagasLLM",
     "LangchainLLMWrapper",
     "llm_factory",
+    "LLMCache",
+    "InMemoryLLMCache",
+    "SqliteLLMCache",
 ]
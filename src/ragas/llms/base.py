@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import typing as t
 from abc import ABC, abstractmethod
@@ -10,12 +11,15 @@ from functools import partial
 from langchain_community.chat_models.vertexai import ChatVertexAI
 from langchain_community.llms import VertexAI
 from langchain_core.language_models import BaseLanguageModel
-from langchain_core.outputs import LLMResult
+from langchain_core.outputs import Generation, LLMResult
 from langchain_openai.chat_models import AzureChatOpenAI, ChatOpenAI
 from langchain_openai.llms import AzureOpenAI, OpenAI
 from langchain_openai.llms.base import BaseOpenAI
 
+from ragas.llms.cache import LLMCache, get_llm_cache_key
+from ragas.rate_limiter import RateLimiter, estimate_tokens
 from ragas.run_config import RunConfig, add_async_retry, add_retry
+from ragas.utils import get_model_identity
 
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
@@ -24,6 +28,9 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# completions with a temperature up to this are treated as deterministic
+DETERMINISTIC_TEMPERATURE = 1e-8
+
 MULTIPLE_COMPLETION_SUPPORTED = [
     OpenAI,
     ChatOpenAI,
@@ -45,6 +52,7 @@ def is_multiple_completion_supported(llm: BaseLanguageModel) -> bool:
 @dataclass
 class BaseRagasLLM(ABC):
     run_config: RunConfig
+    cache: t.Optional[LLMCache] = None
 
     def set_run_config(self, run_config: RunConfig):
         self.run_config = run_config
@@ -53,6 +61,31 @@ class BaseRagasLLM(ABC):
         """Return the temperature to use for completion based on n."""
         return 0.3 if n > 1 else 1e-8
 
+    def get_model_identity(self) -> str:
+        """
+        Return a string that identifies the model, used for caching. Wrappers
+        should return the identity of the model they wrap.
+        """
+        return get_model_identity(self)
+
+    def _get_cache_key(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: float,
+        stop: t.Optional[t.List[str]],
+    ) -> t.Optional[str]:
+        # only deterministic completions are served from the cache
+        if self.cache is None or n != 1 or temperature > DETERMINISTIC_TEMPERATURE:
+            return None
+        return get_llm_cache_key(
+            prompt_str=prompt.to_string(),
+            model=self.get_model_identity(),
+            n=n,
+            temperature=temperature,
+            stop=stop,
+        )
+
     @abstractmethod
     def generate_text(
         self,
@@ -85,9 +118,36 @@ class BaseRagasLLM(ABC):
         is_async: bool = True,
     ) -> LLMResult:
         """Generate text using the given event loop."""
+        cache_key = self._get_cache_key(prompt, n, temperature, stop)
+        if self.cache is not None and cache_key is not None:
+            cached = await self.cache.aget(cache_key)
+            if cached is not None:
+                return _loads_llm_result(cached)
+
+        result = await self._generate(
+            prompt=prompt,
+            n=n,
+            temperature=temperature,
+            stop=stop,
+            callbacks=callbacks,
+            is_async=is_async,
+        )
+        if self.cache is not None and cache_key is not None:
+            await self.cache.aset(cache_key, _dumps_llm_result(result))
+        return result
+
+    async def _generate(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: float,
+        stop: t.Optional[t.List[str]],
+        callbacks: Callbacks,
+        is_async: bool,
+    ) -> LLMResult:
         if is_async:
             agenerate_text_with_retry = add_async_retry(
-                self.agenerate_text, self.run_config
+                self._agenerate_text_with_limits, self.run_config
             )
             return await agenerate_text_with_retry(
                 prompt=prompt,
@@ -98,7 +158,9 @@ class BaseRagasLLM(ABC):
             )
         else:
             loop = asyncio.get_event_loop()
-            generate_text_with_retry = add_retry(self.generate_text, self.run_config)
+            generate_text_with_retry = add_retry(
+                self._generate_text_with_limits, self.run_config
+            )
             generate_text = partial(
                 generate_text_with_retry,
                 prompt=prompt,
@@ -109,6 +171,50 @@ class BaseRagasLLM(ABC):
             )
             return await loop.run_in_executor(None, generate_text)
 
+    async def _agenerate_text_with_limits(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: float,
+        stop: t.Optional[t.List[str]],
+        callbacks: Callbacks,
+    ) -> LLMResult:
+        rate_limiter = self.run_config.get_rate_limiter(self.get_model_identity())
+        if rate_limiter is None:
+            return await self.agenerate_text(
+                prompt, n=n, temperature=temperature, stop=stop, callbacks=callbacks
+            )
+
+        tokens = estimate_tokens(prompt.to_string())
+        await rate_limiter.aacquire(tokens)
+        result = await self.agenerate_text(
+            prompt, n=n, temperature=temperature, stop=stop, callbacks=callbacks
+        )
+        _adjust_rate_limit(rate_limiter, tokens, result)
+        return result
+
+    def _generate_text_with_limits(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: float,
+        stop: t.Optional[t.List[str]],
+        callbacks: Callbacks,
+    ) -> LLMResult:
+        rate_limiter = self.run_config.get_rate_limiter(self.get_model_identity())
+        if rate_limiter is None:
+            return self.generate_text(
+                prompt, n=n, temperature=temperature, stop=stop, callbacks=callbacks
+            )
+
+        tokens = estimate_tokens(prompt.to_string())
+        rate_limiter.acquire(tokens)
+        result = self.generate_text(
+            prompt, n=n, temperature=temperature, stop=stop, callbacks=callbacks
+        )
+        _adjust_rate_limit(rate_limiter, tokens, result)
+        return result
+
 
 class LangchainLLMWrapper(BaseRagasLLM):
     """
@@ -116,15 +222,33 @@ class LangchainLLMWrapper(BaseRagasLLM):
     interface. it implements 2 functions:
     - generate_text: for generating text from a given PromptValue
     - agenerate_text: for generating text from a given PromptValue asynchronously
+
+    With `system_prefix` the static prefix of the prompts is sent as a system
+    message so that provider side prompt caching can reuse it, not every chat
+    model accepts one. By default the prompt is a single human message.
     """
 
     def __init__(
-        self, langchain_llm: BaseLanguageModel, run_config: t.Optional[RunConfig] = None
+        self,
+        langchain_llm: BaseLanguageModel,
+        run_config: t.Optional[RunConfig] = None,
+        cache: t.Optional[LLMCache] = None,
+        system_prefix: bool = False,
     ):
         self.langchain_llm = langchain_llm
         if run_config is None:
             run_config = RunConfig()
         self.set_run_config(run_config)
+        self.cache = cache
+        self.system_prefix = system_prefix
+
+    def get_model_identity(self) -> str:
+        return get_model_identity(self.langchain_llm)
+
+    def _to_model_prompt(self, prompt: PromptValue) -> PromptValue:
+        if self.system_prefix and getattr(prompt, "prefix", ""):
+            return prompt.copy(update={"system_prefix": True})
+        return prompt
 
     def generate_text(
         self,
@@ -135,6 +259,7 @@ class LangchainLLMWrapper(BaseRagasLLM):
         callbacks: Callbacks = None,
     ) -> LLMResult:
         temperature = self.get_temperature(n=n)
+        prompt = self._to_model_prompt(prompt)
         if is_multiple_completion_supported(self.langchain_llm):
             return self.langchain_llm.generate_prompt(
                 prompts=[prompt],
@@ -165,6 +290,7 @@ class LangchainLLMWrapper(BaseRagasLLM):
         callbacks: Callbacks = None,
     ) -> LLMResult:
         temperature = self.get_temperature(n=n)
+        prompt = self._to_model_prompt(prompt)
         if is_multiple_completion_supported(self.langchain_llm):
             return await self.langchain_llm.agenerate_prompt(
                 prompts=[prompt],
@@ -204,10 +330,36 @@ class LangchainLLMWrapper(BaseRagasLLM):
 
 
 def llm_factory(
-    model: str = "gpt-3.5-turbo", run_config: t.Optional[RunConfig] = None
+    model: str = "gpt-3.5-turbo",
+    run_config: t.Optional[RunConfig] = None,
+    cache: t.Optional[LLMCache] = None,
 ) -> BaseRagasLLM:
     timeout = None
     if run_config is not None:
         timeout = run_config.timeout
     openai_model = ChatOpenAI(model=model, timeout=timeout)
-    return LangchainLLMWrapper(openai_model, run_config)
+    return LangchainLLMWrapper(openai_model, run_config, cache=cache)
+
+
+def _adjust_rate_limit(rate_limiter: RateLimiter, estimate: int, result: LLMResult):
+    # replace the estimate with the actual usage when the provider reports it
+    llm_output = result.llm_output or {}
+    total_tokens = (llm_output.get("token_usage") or {}).get("total_tokens")
+    if total_tokens is not None:
+        rate_limiter.adjust(total_tokens - estimate)
+
+
+def _dumps_llm_result(result: LLMResult) -> str:
+    # only the generations are needed by the metrics
+    generations = [
+        [{"text": g.text, "generation_info": g.generation_info} for g in gens]
+        for gens in result.generations
+    ]
+    return json.dumps({"generations": generations}, default=str)
+
+
+def _loads_llm_result(value: str) -> LLMResult:
+    generations = [
+        [Generation(**g) for g in gens] for gens in json.loads(value)["generations"]
+    ]
+    return LLMResult(generations=generations)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import logging
+import typing as t
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.utils.json import parse_json_markdown
+
+from ragas.async_utils import MicroBatcher
+
+if t.TYPE_CHECKING:
+    from langchain_core.callbacks import Callbacks
+
+    from ragas.llms.base import BaseRagasLLM
+    from ragas.llms.output_parser import RagasoutputParser
+    from ragas.llms.prompt import Prompt
+
+logger = logging.getLogger(__name__)
+
+
+class PromptBatcher:
+    """
+    Packs the inputs of the calls of one prompt made concurrently by different
+    rows into a single multi-row prompt (see `Prompt.format_batch`), so that the
+    instruction and the examples are only sent once. Inputs are collected for up
+    to `batch_timeout` seconds or until `batch_size` inputs are waiting.
+
+    The output of each row is parsed on its own with the output parser of the
+    prompt. Rows whose output is missing or can not be parsed fall back to a
+    single-row call. A batched call is traced with the callbacks of the first
+    row of the batch.
+
+    Attributes
+    ----------
+    prompt: Prompt
+        The prompt to batch, its outputs must be JSON.
+    output_parser: RagasoutputParser
+        The parser of the output of a single row.
+    batch_size: int
+        Maximum number of rows sent in one prompt.
+    batch_timeout: float
+        Seconds to wait for more rows before sending a batch that is not full.
+    """
+
+    def __init__(
+        self,
+        prompt: Prompt,
+        output_parser: RagasoutputParser,
+        batch_size: int = 8,
+        batch_timeout: float = 0.05,
+    ):
+        self.prompt = prompt
+        self.output_parser = output_parser
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self._batcher = MicroBatcher(self._generate_batch, batch_size, batch_timeout)
+        self.batches = 0
+        self.batched_rows = 0
+        self.fallbacks = 0
+
+    async def agenerate(
+        self,
+        llm: BaseRagasLLM,
+        inputs: t.Dict[str, t.Any],
+        callbacks: Callbacks = None,
+        is_async: bool = True,
+        max_retries: int = 1,
+    ) -> t.Any:
+        """
+        Return the parsed output of the prompt for `inputs`, or None if it could
+        not be parsed even with a single-row call.
+        """
+        # a prompt whose instruction uses the inputs can not be shared by rows
+        if self.batch_size > 1 and is_async and self.prompt.static_prefix:
+            # rows scored with different llms can not share a prompt
+            output = await self._batcher.submit((llm, inputs, callbacks), id(llm))
+            if output is not None:
+                return output
+            self.fallbacks += 1
+
+        p_value = self.prompt.format(**inputs)
+        result = await llm.generate(p_value, callbacks=callbacks, is_async=is_async)
+        return await self.output_parser.aparse(
+            result.generations[0][0].text, p_value, llm, max_retries
+        )
+
+    async def _generate_batch(
+        self,
+        key: t.Hashable,
+        rows: t.List[t.Tuple[BaseRagasLLM, t.Dict[str, t.Any], Callbacks]],
+    ) -> t.List[t.Any]:
+        if len(rows) == 1:
+            # nothing to share, the single-row fallback is the same call
+            return [None]
+        llm, _, callbacks = rows[0]
+        try:
+            self.batches += 1
+            p_value = self.prompt.format_batch([inputs for _, inputs, _ in rows])
+            result = await llm.generate(p_value, callbacks=callbacks)
+            outputs = self._parse_batch(result.generations[0][0].text, len(rows))
+        except Exception:
+            logger.warning("Batched prompt %s failed", self.prompt.name, exc_info=True)
+            return [None] * len(rows)
+        self.batched_rows += sum(output is not None for output in outputs)
+        return outputs
+
+    def _parse_batch(self, text: str, num_rows: int) -> t.List[t.Any]:
+        try:
+            batch_output = parse_json_markdown(text)
+        except ValueError:
+            logger.warning("Could not parse the output of batched prompt as JSON")
+            return [None] * num_rows
+        if not isinstance(batch_output, dict):
+            return [None] * num_rows
+
+        outputs = []
+        for i in range(num_rows):
+            output = batch_output.get(str(i))
+            if output is not None:
+                try:
+                    output = self.output_parser.parse(json.dumps(output))
+                except OutputParserException:
+                    output = None
+            outputs.append(output)
+        return outputs
+
+
+def get_prompt_batcher(
+    batcher: t.Optional[PromptBatcher],
+    prompt: Prompt,
+    output_parser: RagasoutputParser,
+    batch_size: int,
+) -> PromptBatcher:
+    """
+    Return `batcher` if it still batches `prompt` with `batch_size`, otherwise a
+    new batcher, for metrics whose prompt or batch size changed (e.g. adapt()).
+    """
+    if (
+        batcher is None
+        or batcher.prompt is not prompt
+        or batcher.batch_size != batch_size
+    ):
+        batcher = PromptBatcher(prompt, output_parser, batch_size)
+    return batcher
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import typing as t
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from ragas.utils import get_cache_dir
+
+DEFAULT_CACHE_FILE = "llm_cache.sqlite"
+
+
+def get_llm_cache_key(
+    prompt_str: str,
+    model: str,
+    n: int,
+    temperature: float,
+    stop: t.Optional[t.List[str]],
+) -> str:
+    key = {
+        "prompt": prompt_str,
+        "model": model,
+        "n": n,
+        "temperature": temperature,
+        "stop": stop,
+    }
+    dumped = json.dumps(key, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(dumped.encode("utf8")).hexdigest()
+
+
+class LLMCache(ABC):
+    """
+    Cache for LLM responses. Values are the serialized responses, keys are
+    created with `get_llm_cache_key`.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _get(self, key: str) -> t.Optional[str]: ...
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    def get(self, key: str) -> t.Optional[str]:
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def aget(self, key: str) -> t.Optional[str]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: str) -> None:
+        self.set(key, value)
+
+    def stats(self) -> t.Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class InMemoryLLMCache(LLMCache):
+    """
+    Least recently used cache that lives as long as the process does.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        super().__init__()
+        self.maxsize = maxsize
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> t.Optional[str]:
+        with self._lock:
+            if key not in self._cache:
+                return None
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class SqliteLLMCache(LLMCache):
+    """
+    Cache stored in a SQLite file so that responses survive across runs. By
+    default it is stored in the ragas cache dir.
+    """
+
+    def __init__(self, path: t.Optional[str] = None):
+        super().__init__()
+        self.path = path or os.path.join(get_cache_dir(), DEFAULT_CACHE_FILE)
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        # the connection is shared by the executor threads, access is serialized
+        # with the lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def _get(self, key: str) -> t.Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    # disk I/O runs in the default executor so that it does not block the loop
+    async def aget(self, key: str) -> t.Optional[str]:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.set, key, value)
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
+import re
 import typing as t
+import warnings
 from dataclasses import dataclass
-from functools import partial
 
-from ragas.run_config import RunConfig, add_async_retry, add_retry
+from ragas.run_config import RunConfig
 
 logger = logging.getLogger(__name__)
 
+_JSON_START = re.compile(r"[{\[]")
+_decoder = json.JSONDecoder()
+
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
 
@@ -75,44 +78,90 @@ Output:
 """
 
 
+_CLOSING_CONTEXT = (",", ":", "}", "]", "")
+
+
+def _next_non_space(text: str, pos: int) -> str:
+    while pos < len(text) and text[pos].isspace():
+        pos += 1
+    return text[pos] if pos < len(text) else ""
+
+
+def repair_json(text: str) -> str:
+    """
+    Fix the usual mistakes in JSON written by LLMs without calling the LLM:
+    trailing commas, single quoted strings and unescaped double quotes inside
+    strings. A quote only ends a string when it is followed by `,`, `:`, `}`,
+    `]` or the end of the text, otherwise it is part of the string.
+    """
+    repaired: t.List[str] = []
+    quote = None  # quote character of the string being read, if any
+    last = ""  # last character written outside of a string
+    pos = 0
+    while pos < len(text):
+        char = text[pos]
+        if quote is None:
+            if char in "\"'" and last in ("{", "[", ",", ":"):
+                quote = char
+                repaired.append('"')
+            elif char == "," and _next_non_space(text, pos + 1) in ("}", "]"):
+                pass
+            else:
+                repaired.append(char)
+                if not char.isspace():
+                    last = char
+        elif char == "\\" and pos + 1 < len(text):
+            escaped = text[pos + 1]
+            # \' is not a valid escape in JSON
+            repaired.append(escaped if escaped == "'" else char + escaped)
+            pos += 1
+        elif char == quote and _next_non_space(text, pos + 1) in _CLOSING_CONTEXT:
+            quote = None
+            repaired.append('"')
+            last = '"'
+        elif char == '"':
+            repaired.append('\\"')
+        else:
+            repaired.append(char)
+        pos += 1
+    return "".join(repaired)
+
+
 @dataclass
 class JsonLoader:
     max_retries: int = 2
 
-    def _safe_load(self, text: str, llm: BaseRagasLLM, callbacks: Callbacks = None):
-        retry = 0
-        while retry <= self.max_retries:
-            try:
-                _json = self._load_all_jsons(text)
-                return _json[0] if len(_json) == 1 else _json
-            except ValueError:
-                from ragas.llms.prompt import PromptValue
-
-                results = llm.generate_text(
-                    PromptValue(prompt_str=JSON_PROMPT.format(input=text)),
-                    n=1,
-                    callbacks=callbacks,
-                )
-                text = results.generations[0][0].text
-            retry += 1
-
-        return {}
+    def _load(self, text: str):
+        """
+        Load the JSON values in the text, repairing them locally if needed.
+        Raises ValueError if that is not enough.
+        """
+        try:
+            _json = self._load_all_jsons(text)
+        except ValueError:
+            _json = self._load_all_jsons(repair_json(text))
+        return _json[0] if len(_json) == 1 else _json
 
     async def _asafe_load(
-        self, text: str, llm: BaseRagasLLM, callbacks: Callbacks = None
+        self,
+        text: str,
+        llm: BaseRagasLLM,
+        callbacks: Callbacks = None,
+        is_async: bool = True,
     ):
         retry = 0
         while retry <= self.max_retries:
             try:
-                _json = self._load_all_jsons(text)
-                return _json[0] if len(_json) == 1 else _json
+                return self._load(text)
             except ValueError:
                 from ragas.llms.prompt import PromptValue
 
-                results = await llm.agenerate_text(
+                # same path as the other generations: retries, cache and limits
+                results = await llm.generate(
                     PromptValue(prompt_str=JSON_PROMPT.format(input=text)),
                     n=1,
                     callbacks=callbacks,
+                    is_async=is_async,
                 )
                 text = results.generations[0][0].text
             retry += 1
@@ -125,57 +174,50 @@ class JsonLoader:
         llm: BaseRagasLLM,
         callbacks: Callbacks = None,
         is_async: bool = True,
-        run_config: RunConfig = RunConfig(),
+        run_config: t.Optional[RunConfig] = None,
     ) -> t.Union[t.Dict, t.List]:
-        if is_async:
-            _asafe_load_with_retry = add_async_retry(self._asafe_load, run_config)
-            return await _asafe_load_with_retry(text=text, llm=llm, callbacks=callbacks)
-        else:
-            _safe_load_with_retry = add_retry(self._safe_load, run_config)
-            loop = asyncio.get_event_loop()
-            safe_load = partial(
-                _safe_load_with_retry, text=text, llm=llm, callbacks=callbacks
-            )
-            return await loop.run_in_executor(
-                None,
-                safe_load,
+        """
+        Load the JSON in the text. Broken JSON is repaired locally first and
+        then rewritten by the llm, up to `max_retries` times. The llm calls are
+        retried with the run config of the llm.
+        """
+        if run_config is not None:
+            warnings.warn(
+                "The run_config argument of safe_load is deprecated and has no"
+                " effect, the llm calls use the run config of the llm.",
+                stacklevel=2,
+                category=DeprecationWarning,
             )
+        return await self._asafe_load(
+            text=text, llm=llm, callbacks=callbacks, is_async=is_async
+        )
+
+    def iter_jsons(self, text: str) -> t.Iterator[t.Tuple[int, int, t.Any]]:
+        """
+        Yield `(start, end, value)` for every top-level JSON object or array in
+        the text, in a single pass. Braces inside JSON strings are handled by the
+        decoder, so they do not cut a value short. A `{` or `[` that does not
+        start a valid JSON value is skipped and the scan goes on from the next
+        character.
+        """
+        pos = 0
+        while True:
+            match = _JSON_START.search(text, pos)
+            if match is None:
+                return
+            try:
+                value, end = _decoder.raw_decode(text, match.start())
+            except json.JSONDecodeError:
+                pos = match.start() + 1
+                continue
+            yield match.start(), end, value
+            pos = end
 
     def _load_all_jsons(self, text):
-        start, end = self._find_outermost_json(text)
-        _json = json.loads(text[start:end])
-        text = text.replace(text[start:end], "", 1)
-        start, end = self._find_outermost_json(text)
-        if (start, end) == (-1, -1):
-            return [_json]
-        else:
-            return [_json] + self._load_all_jsons(text)
-
-    def _find_outermost_json(self, text):
-        stack = []
-        start_index = -1
-
-        for i, char in enumerate(text):
-            if char in "{[":
-                if len(stack) == 0:
-                    start_index = i
-                stack.append(char)
-
-            elif char in "}]":
-                if len(stack) > 0:
-                    last = stack.pop()
-                    if (char == "}" and last != "{") or (char == "]" and last != "["):
-                        # Mismatched closing brace/bracket, invalid JSON
-                        break
-
-                if len(stack) == 0 and start_index != -1:
-                    # Found a valid outermost JSON
-                    return (
-                        start_index,
-                        i + 1,
-                    )  # Add 1 to include the closing brace/bracket in the range
-
-        return -1, -1  # No valid JSON found
+        _jsons = [value for _, _, value in self.iter_jsons(text)]
+        if not _jsons:
+            raise ValueError("No JSON found in the text")
+        return _jsons
 
 
 json_loader = JsonLoader()
@@ -1,12 +1,15 @@
 import json
 import logging
+import re
 import typing as t
+from collections import Counter
 
 from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.pydantic_v1 import BaseModel
 
 from ragas.llms import BaseRagasLLM
+from ragas.llms.json_load import json_loader, repair_json
 from ragas.llms.prompt import Prompt, PromptValue
 
 logger = logging.getLogger(__name__)
@@ -53,21 +56,118 @@ def get_json_format_instructions(pydantic_object: t.Type[TBaseModel]) -> str:
     return resp
 
 
+# how the outputs were parsed: "parsed" as is, "repaired" locally, "llm_fixed"
+# with the FIX_OUTPUT_FORMAT prompt or "failed"
+output_parser_counts: t.Counter[str] = Counter()
+
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+
+def _extract_json(text: str) -> t.Any:
+    """The first top-level JSON value in the text, repaired if needed, or None."""
+    match = _CODE_FENCE.search(text)
+    if match is not None:
+        text = match.group(1)
+    for candidate in (text, repair_json(text)):
+        try:
+            for _, _, value in json_loader.iter_jsons(candidate):
+                return value
+        except ValueError:
+            continue
+    return None
+
+
+def _is_model(type_: t.Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, BaseModel)
+
+
+def _coerce_to_schema(model: t.Type[BaseModel], value: t.Any) -> t.Any:
+    """
+    Reshape a JSON value that is close to the schema of the model: wrap a
+    single object in a list and unwrap a list of one object or an object nested
+    under a single unknown key, and fill missing string and list fields with
+    empty values. The field values themselves are converted by pydantic.
+    """
+    fields = model.__fields__
+    if "__root__" in fields:
+        root = fields["__root__"]
+        if t.get_origin(root.outer_type_) is list:
+            if isinstance(value, dict) and len(value) == 1:
+                nested = next(iter(value.values()))
+                if isinstance(nested, list):
+                    value = nested
+            if isinstance(value, dict):
+                value = [value]
+            if isinstance(value, list) and _is_model(root.type_):
+                value = [_coerce_to_schema(root.type_, item) for item in value]
+        elif _is_model(root.type_):
+            value = _coerce_to_schema(root.type_, value)
+        return value
+
+    if isinstance(value, list) and len(value) == 1:
+        value = value[0]
+    if not isinstance(value, dict):
+        return value
+    aliases = {field.alias for field in fields.values()}
+    if len(value) == 1 and not aliases & value.keys():
+        nested = next(iter(value.values()))
+        if isinstance(nested, dict):
+            value = nested
+
+    value = dict(value)
+    for field in fields.values():
+        is_list = t.get_origin(field.outer_type_) is list
+        if field.alias not in value:
+            if is_list:
+                value[field.alias] = []
+            elif field.outer_type_ is str:
+                value[field.alias] = ""
+        elif _is_model(field.type_):
+            item = value[field.alias]
+            if is_list and isinstance(item, list):
+                value[field.alias] = [_coerce_to_schema(field.type_, i) for i in item]
+            elif not is_list:
+                value[field.alias] = _coerce_to_schema(field.type_, item)
+    return value
+
+
 class RagasoutputParser(PydanticOutputParser):
+    def _parse_locally(self, result: str) -> t.Tuple[t.Any, str]:
+        """
+        Parse the output, repairing it without the llm if needed. Returns the
+        parsed output (None if it failed) and how it was parsed.
+        """
+        try:
+            return super().parse(result), "parsed"
+        except OutputParserException:
+            pass
+
+        value = _extract_json(result)
+        if value is None:
+            return None, "failed"
+        value = _coerce_to_schema(self.pydantic_object, value)
+        try:
+            return super().parse(json.dumps(value)), "repaired"
+        except OutputParserException:
+            return None, "failed"
+
     async def aparse(  # type: ignore
         self, result: str, prompt: PromptValue, llm: BaseRagasLLM, max_retries: int = 1
     ):
-        try:
-            output = super().parse(result)
-        except OutputParserException:
-            if max_retries != 0:
-                p_value = FIX_OUTPUT_FORMAT.format(
-                    prompt=prompt.to_string(), completion=result
-                )
-                output = await llm.generate(p_value)
-                result = output.generations[0][0].text
-                return await self.aparse(result, prompt, llm, max_retries - 1)
-            else:
-                logger.warning("Failed to parse output. Returning None.")
-                return None
+        output, path = self._parse_locally(result)
+        retries = 0
+        while output is None and retries < max_retries:
+            p_value = FIX_OUTPUT_FORMAT.format(
+                prompt=prompt.to_string(), completion=result
+            )
+            fixed = await llm.generate(p_value)
+            result = fixed.generations[0][0].text
+            output, path = self._parse_locally(result)
+            if output is not None:
+                path = "llm_fixed"
+            retries += 1
+
+        output_parser_counts[path] += 1
+        if output is None:
+            logger.warning("Failed to parse output. Returning None.")
         return output
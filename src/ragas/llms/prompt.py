@@ -4,11 +4,13 @@ import json
 import logging
 import os
 import typing as t
+from string import Formatter
 
-from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.prompt_values import PromptValue as BasePromptValue
-from langchain_core.pydantic_v1 import BaseModel, root_validator
+from langchain_core.pydantic_v1 import BaseModel, PrivateAttr, root_validator
 
+from ragas.async_utils import run_async_tasks
 from ragas.llms import BaseRagasLLM
 from ragas.llms.json_load import json_loader
 from ragas.utils import get_cache_dir
@@ -20,9 +22,26 @@ logger = logging.getLogger(__name__)
 
 class PromptValue(BasePromptValue):
     prompt_str: str
+    # start of `prompt_str` that is the same for every input of the prompt
+    prefix: str = ""
+    # send the prefix as a system message, not every chat model accepts one
+    system_prefix: bool = False
 
     def to_messages(self) -> t.List[BaseMessage]:
-        """Return prompt as a list of Messages."""
+        """
+        Return prompt as a list of Messages. With `system_prefix` the static
+        prefix, if any, is sent as a separate system message so that provider
+        side prompt caching can reuse it across calls.
+        """
+        if (
+            self.system_prefix
+            and self.prefix
+            and self.prompt_str.startswith(self.prefix)
+        ):
+            return [
+                SystemMessage(content=self.prefix),
+                HumanMessage(content=self.prompt_str[len(self.prefix) :]),
+            ]
         return [HumanMessage(content=self.to_string())]
 
     def to_string(self) -> str:
@@ -52,6 +71,24 @@ class Prompt(BaseModel):
     output_key: str
     output_type: t.Literal["json", "str"] = "json"
     language: str = "english"
+    # rendered lazily from the fields and dropped when a field is set
+    _template: t.Optional[str] = PrivateAttr(default=None)
+    _static_prefix: t.Optional[str] = PrivateAttr(default=None)
+    _input_labels: t.Optional[t.List[t.Tuple[str, str]]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: t.Any):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._invalidate()
+
+    def _invalidate(self):
+        """
+        Drop everything rendered from the fields. Setting a field does it
+        automatically, call it after changing a field in place, e.g. an example.
+        """
+        self._template = None
+        self._static_prefix = None
+        self._input_labels = None
 
     @root_validator
     def validate_prompt(cls, values: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
@@ -93,6 +130,23 @@ class Prompt(BaseModel):
         """
         Generate the prompt string from the variables.
         """
+        if self._template is None:
+            prompt_str = self._instruction_and_examples_str()
+            prompt_str += "\nYour actual task:\n"
+
+            if self.input_keys:
+                prompt_str += "".join(f"\n{key}: {{{key}}}" for key in self.input_keys)
+            if self.output_key:
+                prompt_str += f"\n{self.output_key}: \n"
+            self._template = prompt_str
+
+        return self._template
+
+    def _instruction_and_examples_str(self) -> str:
+        """
+        The part of the prompt string that does not depend on the inputs, with
+        the curly braces escaped for `str.format`.
+        """
         prompt_elements = [self.instruction]
         if self.output_format_instruction:
             prompt_elements.append(
@@ -122,14 +176,37 @@ class Prompt(BaseModel):
                     )
                 prompt_str += "\n"
 
-        prompt_str += "\nYour actual task:\n"
+        return prompt_str
 
-        if self.input_keys:
-            prompt_str += "".join(f"\n{key}: {{{key}}}" for key in self.input_keys)
-        if self.output_key:
-            prompt_str += f"\n{self.output_key}: \n"
+    @property
+    def static_prefix(self) -> str:
+        """
+        The start of every prompt made with `format`: the instruction, the output
+        format instruction and the examples. It is rendered once so that it is
+        the same byte for byte on every call, which lets provider side prompt
+        caching hit. Empty if the instruction or the examples use the inputs.
+        """
+        if self._static_prefix is None:
+            prefix = self._instruction_and_examples_str() + "\nYour actual task:\n"
+            has_fields = any(
+                field is not None for _, field, _, _ in Formatter().parse(prefix)
+            )
+            self._static_prefix = "" if has_fields else prefix.format()
+        return self._static_prefix
 
-        return prompt_str
+    def _format_inputs(self, kwargs: t.Dict[str, t.Any]) -> str:
+        """
+        Render the inputs part of the prompt, what `to_string().format(**kwargs)`
+        adds after the static prefix, without parsing the whole template.
+        """
+        if self._input_labels is None:
+            self._input_labels = [(key, f"\n{key}: ") for key in self.input_keys]
+        inputs_str = "".join(
+            label + format(kwargs[key]) for key, label in self._input_labels
+        )
+        if self.output_key:
+            inputs_str += f"\n{self.output_key}: \n"
+        return inputs_str
 
     def get_example_str(self, example_no: int) -> str:
         """
@@ -157,8 +234,41 @@ class Prompt(BaseModel):
             raise ValueError(
                 f"Input variables {self.input_keys} do not match with the given parameters {list(kwargs.keys())}"
             )
-        prompt = self.to_string()
-        return PromptValue(prompt_str=prompt.format(**kwargs))
+        prefix = self.static_prefix
+        if not prefix:
+            return PromptValue(prompt_str=self.to_string().format(**kwargs))
+        return PromptValue(
+            prompt_str=prefix + self._format_inputs(kwargs), prefix=prefix
+        )
+
+    def format_batch(self, inputs: t.List[t.Dict[str, t.Any]]) -> PromptValue:
+        """
+        Format the prompt for several inputs at once. The instruction and the
+        examples are only included once and the output is a JSON object that maps
+        the index of each input ("0", "1", ...) to its output.
+        """
+        for kwargs in inputs:
+            if set(self.input_keys) != set(kwargs.keys()):
+                raise ValueError(
+                    f"Input variables {self.input_keys} do not match with the given parameters {list(kwargs.keys())}"
+                )
+        if not self.static_prefix:
+            raise ValueError(
+                f"prompt {self.name} can not be batched, its instruction or examples use the inputs"
+            )
+        prompt_str = self.static_prefix
+        prompt_str += (
+            f"\nDo the task for each of the {len(inputs)} inputs below, independently"
+            " of each other. Output a single JSON object whose keys are the input"
+            f' numbers ("0", "1", ...) and whose values are the {self.output_key} of'
+            " that input, each one following the output JSON schema above.\n"
+        )
+        for i, kwargs in enumerate(inputs):
+            prompt_str += f"\ninput {i}:"
+            prompt_str += "".join(f"\n{key}: {kwargs[key]}" for key in self.input_keys)
+            prompt_str += "\n"
+        prompt_str += f"\n{self.output_key}: \n"
+        return PromptValue(prompt_str=prompt_str, prefix=self.static_prefix)
 
     def adapt(
         self, language: str, llm: BaseRagasLLM, cache_dir: t.Optional[str] = None
@@ -185,19 +295,28 @@ class Prompt(BaseModel):
         for example in self.examples:
             prompts.extend(
                 [
-                    str_translation.format(
-                        translate_to=language, input=example.get(key)
+                    (
+                        str_translation.format(
+                            translate_to=language, input=example.get(key)
+                        ),
+                        False,
                     )
                     for key in self.input_keys
                 ]
             )
             prompts.append(
-                json_translatation.format(
-                    translate_to=language, input=example.get(self.output_key)
+                (
+                    json_translatation.format(
+                        translate_to=language, input=example.get(self.output_key)
+                    ),
+                    True,
                 )
                 if self.output_type.lower() == "json"
-                else str_translation.format(
-                    translate_to=language, input=example.get(self.output_key)
+                else (
+                    str_translation.format(
+                        translate_to=language, input=example.get(self.output_key)
+                    ),
+                    False,
                 )
             )
             if self.output_type.lower() == "json":
@@ -211,10 +330,13 @@ class Prompt(BaseModel):
                 ):
                     output_keys.append([get_all_keys(item) for item in output])
 
-        # NOTE: this is a slow loop, consider Executor to fasten this
-        results = []
-        for p in prompts:
-            results.append(llm.generate_text(p).generations[0][0].text)
+        async def translate(p_value: PromptValue, is_json: bool) -> t.Any:
+            # same path as the metrics: retries, cache and rate limits
+            result = await llm.generate(p_value)
+            text = result.generations[0][0].text
+            return await json_loader.safe_load(text, llm) if is_json else text
+
+        results = run_async_tasks([translate(p, is_json) for p, is_json in prompts])
         per_example_items = len(self.input_keys) + 1
         grouped_results = [
             results[i : i + per_example_items]
@@ -228,11 +350,7 @@ class Prompt(BaseModel):
             example_dict.update(
                 {k: v for k, v in zip(self.input_keys, example[: len(self.input_keys)])}
             )
-            example_dict[self.output_key] = (
-                json_loader._safe_load(example[-1], llm)
-                if self.output_type.lower() == "json"
-                else example[-1]
-            )
+            example_dict[self.output_key] = example[-1]
 
             if self.output_type.lower() == "json":
                 output = example_dict[self.output_key]
@@ -249,6 +367,7 @@ class Prompt(BaseModel):
 
             self.examples[i] = example_dict
 
+        # also drops the rendered prefix of the old examples
         self.language = language
 
         # TODO:Validate the prompt after adaptation
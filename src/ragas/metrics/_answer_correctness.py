@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
 from dataclasses import dataclass, field
@@ -13,7 +14,7 @@ from ragas.metrics._answer_similarity import AnswerSimilarity
 from ragas.metrics._faithfulness import (
     LONG_FORM_ANSWER_PROMPT,
     HasSegmentMethod,
-    _statements_output_parser,
+    agenerate_statements,
 )
 from ragas.metrics.base import (
     EvaluationMode,
@@ -141,7 +142,6 @@ CORRECTNESS_PROMPT = Prompt(
 
 @dataclass
 class AnswerCorrectness(MetricWithLLM, MetricWithEmbeddings):
-
     """
     Measures answer correctness compared to ground truth as a combination of
     factuality and semantic similarity.
@@ -211,65 +211,86 @@ class AnswerCorrectness(MetricWithLLM, MetricWithEmbeddings):
         )
         return prompt_value
 
-    async def _ascore(self, row: t.Dict, callbacks: Callbacks, is_async: bool) -> float:
+    async def _acompute_factuality(
+        self, row: t.Dict, callbacks: Callbacks, is_async: bool
+    ) -> float:
         assert self.llm is not None, "LLM must be set"
 
         question = row["question"]
-        statements = {}
-        for item in ["answer", "ground_truth"]:
-            p_value = self._create_statements_prompt(question, row[item])
-            item_statement = await self.llm.generate(
-                p_value, callbacks=callbacks, is_async=is_async
-            )
-            statements[item] = await _statements_output_parser.aparse(
-                item_statement.generations[0][0].text,
-                p_value,
-                self.llm,
-                self.max_retries,
-            )
-            statements[item] = (
-                statements[item].dicts() if statements[item] is not None else []
-            )
-
-        if not all([val == [] for val in statements.values()]):
-            ground_truth = [
-                statement
-                for item in statements["ground_truth"]
-                for statement in item["simpler_statements"]
+        # the statements of the answer and the ground truth are independent
+        answer_statements, ground_truth_statements = await asyncio.gather(
+            *[
+                agenerate_statements(
+                    self.llm,
+                    self._create_statements_prompt(question, row[item]),
+                    callbacks,
+                    is_async,
+                    self.max_retries,
+                )
+                for item in ["answer", "ground_truth"]
             ]
-            answer = [
-                statement
-                for item in statements["answer"]
-                for statement in item["simpler_statements"]
+        )
+        statements = {
+            item: item_statements.dicts() if item_statements is not None else []
+            for item, item_statements in [
+                ("answer", answer_statements),
+                ("ground_truth", ground_truth_statements),
             ]
-            p_value = self.correctness_prompt.format(
-                question=question,
-                ground_truth=ground_truth,
-                answer=answer,
-            )
-            is_statement_present = await self.llm.generate(
-                p_value, callbacks=callbacks, is_async=is_async
-            )
-            result_text = is_statement_present.generations[0][0].text
+        }
 
-            answers = await _output_parser.aparse(
-                result_text, p_value, self.llm, self.max_retries
-            )
-            if answers is None:
-                return np.nan
+        if all([val == [] for val in statements.values()]):
+            return 1.0
+
+        ground_truth = [
+            statement
+            for item in statements["ground_truth"]
+            for statement in item["simpler_statements"]
+        ]
+        answer = [
+            statement
+            for item in statements["answer"]
+            for statement in item["simpler_statements"]
+        ]
+        p_value = self.correctness_prompt.format(
+            question=question,
+            ground_truth=ground_truth,
+            answer=answer,
+        )
+        is_statement_present = await self.llm.generate(
+            p_value, callbacks=callbacks, is_async=is_async
+        )
+        result_text = is_statement_present.generations[0][0].text
 
-            f1_score = self._compute_statement_presence(answers)
-        else:
-            f1_score = 1.0
+        answers = await _output_parser.aparse(
+            result_text, p_value, self.llm, self.max_retries
+        )
+        if answers is None:
+            return np.nan
 
+        return self._compute_statement_presence(answers)
+
+    async def _acompute_similarity(
+        self, row: t.Dict, callbacks: Callbacks, is_async: bool
+    ) -> float:
         if self.weights[1] == 0:
-            similarity_score = 0.0
-        else:
-            assert self.answer_similarity is not None, "AnswerSimilarity must be set"
+            return 0.0
 
-            similarity_score = await self.answer_similarity.ascore(
-                row, callbacks=callbacks, is_async=is_async
-            )
+        assert self.answer_similarity is not None, "AnswerSimilarity must be set"
+        return await self.answer_similarity.ascore(
+            row, callbacks=callbacks, is_async=is_async
+        )
+
+    async def _ascore(self, row: t.Dict, callbacks: Callbacks, is_async: bool) -> float:
+        assert self.llm is not None, "LLM must be set"
+
+        # the similarity only needs the embeddings, so it is computed while
+        # waiting for the llm
+        f1_score, similarity_score = await asyncio.gather(
+            self._acompute_factuality(row, callbacks, is_async),
+            self._acompute_similarity(row, callbacks, is_async),
+        )
+        if np.isnan(f1_score):
+            return np.nan
 
         score = np.average(
             [f1_score, similarity_score],
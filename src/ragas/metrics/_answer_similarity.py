@@ -7,7 +7,13 @@ from dataclasses import dataclass
 import numpy as np
 
 from ragas.embeddings.base import HuggingfaceEmbeddings
-from ragas.metrics.base import EvaluationMode, MetricWithEmbeddings, MetricWithLLM
+from ragas.metrics.base import (
+    EMBEDDING_ARTIFACT,
+    EvaluationMode,
+    MetricWithEmbeddings,
+    MetricWithLLM,
+    get_or_compute_artifact,
+)
 
 if t.TYPE_CHECKING:
     from langchain_core.callbacks.base import Callbacks
@@ -49,6 +55,15 @@ class AnswerSimilarity(MetricWithLLM, MetricWithEmbeddings):
                 **self.embeddings.encode_kwargs,
             }
 
+    async def _aembed_text(self, text: str) -> t.List[float]:
+        assert self.embeddings is not None, "embeddings must be set"
+        embeddings = self.embeddings
+        return await get_or_compute_artifact(
+            EMBEDDING_ARTIFACT,
+            f"{id(embeddings)}:{text}",
+            lambda: embeddings.embed_text(text),
+        )
+
     async def _ascore(
         self: t.Self, row: t.Dict, callbacks: Callbacks, is_async: bool
     ) -> float:
@@ -62,8 +77,8 @@ class AnswerSimilarity(MetricWithLLM, MetricWithEmbeddings):
                 "async score [ascore()] not implemented for HuggingFace embeddings"
             )
         else:
-            embedding_1 = np.array(await self.embeddings.embed_text(ground_truth))
-            embedding_2 = np.array(await self.embeddings.embed_text(answer))
+            embedding_1 = np.array(await self._aembed_text(ground_truth))
+            embedding_2 = np.array(await self._aembed_text(answer))
             # Normalization factors of the above embeddings
             norms_1 = np.linalg.norm(embedding_1, keepdims=True)
             norms_2 = np.linalg.norm(embedding_2, keepdims=True)
@@ -8,6 +8,8 @@ import numpy as np
 from datasets import Dataset
 from langchain.pydantic_v1 import BaseModel, Field
 
+from ragas.async_utils import gather_with_limit
+from ragas.llms.batching import PromptBatcher, get_prompt_batcher
 from ragas.llms.output_parser import RagasoutputParser, get_json_format_instructions
 from ragas.llms.prompt import Prompt, PromptValue
 from ragas.metrics.base import EvaluationMode, MetricWithLLM, ensembler
@@ -84,13 +86,19 @@ class ContextPrecision(MetricWithLLM):
     name : str
     evaluation_mode: EvaluationMode
     context_precision_prompt: Prompt
+    batch_size: int
+        Opt-in batch mode, the contexts verified at the same time (of this row
+        and of other rows) are sent to the llm in prompts of up to `batch_size`
+        contexts. Only used when reproducibility is 1.
     """
 
     name: str = "context_precision"  # type: ignore
     evaluation_mode: EvaluationMode = EvaluationMode.qcg  # type: ignore
     context_precision_prompt: Prompt = field(default_factory=lambda: CONTEXT_PRECISION)
     max_retries: int = 1
+    batch_size: int = 1
     _reproducibility: int = 1
+    _batcher: t.Optional[PromptBatcher] = field(default=None, init=False, repr=False)
 
     @property
     def reproducibility(self):
@@ -118,13 +126,16 @@ class ContextPrecision(MetricWithLLM):
 
         return row["question"], row["contexts"], row[answer]
 
-    def _context_precision_prompt(self, row: t.Dict) -> t.List[PromptValue]:
+    def _context_precision_inputs(self, row: t.Dict) -> t.List[t.Dict[str, t.Any]]:
         question, contexts, answer = self._get_row_attributes(row)
         return [
-            self.context_precision_prompt.format(
-                question=question, context=c, answer=answer
-            )
-            for c in contexts
+            {"question": question, "context": c, "answer": answer} for c in contexts
+        ]
+
+    def _context_precision_prompt(self, row: t.Dict) -> t.List[PromptValue]:
+        return [
+            self.context_precision_prompt.format(**inputs)
+            for inputs in self._context_precision_inputs(row)
         ]
 
     def _calculate_average_precision(
@@ -147,6 +158,36 @@ class ContextPrecision(MetricWithLLM):
             )
         return score
 
+    async def _averify_context(
+        self, inputs: t.Dict[str, t.Any], callbacks: Callbacks, is_async: bool
+    ) -> t.List[t.Dict]:
+        assert self.llm is not None, "LLM is not set"
+
+        if self.batch_size > 1 and self.reproducibility == 1:
+            self._batcher = get_prompt_batcher(
+                self._batcher,
+                self.context_precision_prompt,
+                _output_parser,
+                self.batch_size,
+            )
+            result = await self._batcher.agenerate(
+                self.llm, inputs, callbacks, is_async, self.max_retries
+            )
+            return [result.dict()] if result is not None else []
+
+        prompt = self.context_precision_prompt.format(**inputs)
+        results = await self.llm.generate(
+            prompt,
+            callbacks=callbacks,
+            is_async=is_async,
+            n=self.reproducibility,
+        )
+        results = [
+            await _output_parser.aparse(item.text, prompt, self.llm, self.max_retries)
+            for item in results.generations[0]
+        ]
+        return [result.dict() for result in results if result is not None]
+
     async def _ascore(
         self: t.Self,
         row: t.Dict,
@@ -155,23 +196,17 @@ class ContextPrecision(MetricWithLLM):
     ) -> float:
         assert self.llm is not None, "LLM is not set"
 
-        human_prompts = self._context_precision_prompt(row)
-        responses = []
-        for hp in human_prompts:
-            results = await self.llm.generate(
-                hp,
-                callbacks=callbacks,
-                is_async=is_async,
-                n=self.reproducibility,
-            )
-            results = [
-                await _output_parser.aparse(item.text, hp, self.llm, self.max_retries)
-                for item in results.generations[0]
-            ]
-
-            responses.append(
-                [result.dict() for result in results if result is not None]
-            )
+        # the contexts are verified independently of each other, so they are
+        # sent concurrently. The calls of all the rows using this llm stay
+        # under its `max_workers`
+        responses = await gather_with_limit(
+            [
+                self._averify_context(inputs, callbacks, is_async)
+                for inputs in self._context_precision_inputs(row)
+            ],
+            limit=self.llm.run_config.max_workers,
+            group=id(self.llm),
+        )
 
         answers = []
         for response in responses:
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 import numpy as np
 from langchain_core.pydantic_v1 import BaseModel
 
+from ragas.llms.batching import PromptBatcher, get_prompt_batcher
 from ragas.llms.output_parser import RagasoutputParser, get_json_format_instructions
 from ragas.llms.prompt import Prompt
 from ragas.metrics.base import EvaluationMode, MetricWithLLM, ensembler
@@ -109,7 +110,6 @@ CONTEXT_RECALL_RA = Prompt(
 
 @dataclass
 class ContextRecall(MetricWithLLM):
-
     """
     Estimates context recall by estimating TP and FN using annotated answer and
     retrieved context.
@@ -117,13 +117,18 @@ class ContextRecall(MetricWithLLM):
     Attributes
     ----------
     name : str
+    batch_size : int
+        Opt-in batch mode, the rows scored at the same time are sent to the llm
+        in prompts of up to `batch_size` rows. Only used when reproducibility is 1.
     """
 
     name: str = "context_recall"  # type: ignore
     evaluation_mode: EvaluationMode = EvaluationMode.qcg  # type: ignore
     context_recall_prompt: Prompt = field(default_factory=lambda: CONTEXT_RECALL_RA)
     max_retries: int = 1
+    batch_size: int = 1
     _reproducibility: int = 1
+    _batcher: t.Optional[PromptBatcher] = field(default=None, init=False, repr=False)
 
     @property
     def reproducibility(self):
@@ -146,11 +151,14 @@ class ContextRecall(MetricWithLLM):
             logger.warning("reproducibility cannot be less than 1, setting to 1")
             self.reproducibility = 1
 
-    def _create_context_recall_prompt(self, row: t.Dict) -> PromptValue:
+    def _context_recall_inputs(self, row: t.Dict) -> t.Dict[str, t.Any]:
         qstn, ctx, gt = row["question"], row["contexts"], row["ground_truth"]
         ctx = "\n".join(ctx) if isinstance(ctx, list) else ctx
 
-        return self.context_recall_prompt.format(question=qstn, context=ctx, answer=gt)
+        return {"question": qstn, "context": ctx, "answer": gt}
+
+    def _create_context_recall_prompt(self, row: t.Dict) -> PromptValue:
+        return self.context_recall_prompt.format(**self._context_recall_inputs(row))
 
     def _compute_score(self, response: t.Any) -> float:
         response = [1 if item.attributed else 0 for item in response.__root__]
@@ -165,19 +173,38 @@ class ContextRecall(MetricWithLLM):
 
     async def _ascore(self, row: t.Dict, callbacks: Callbacks, is_async: bool) -> float:
         assert self.llm is not None, "set LLM before use"
-        p_value = self._create_context_recall_prompt(row)
-        results = await self.llm.generate(
-            p_value,
-            callbacks=callbacks,
-            is_async=is_async,
-            n=self.reproducibility,
-        )
-        results = [results.generations[0][i].text for i in range(self.reproducibility)]
-
-        answers = [
-            await _output_parser.aparse(text, p_value, self.llm, self.max_retries)
-            for text in results
-        ]
+        if self.batch_size > 1 and self.reproducibility == 1:
+            self._batcher = get_prompt_batcher(
+                self._batcher,
+                self.context_recall_prompt,
+                _output_parser,
+                self.batch_size,
+            )
+            answers = [
+                await self._batcher.agenerate(
+                    self.llm,
+                    self._context_recall_inputs(row),
+                    callbacks,
+                    is_async,
+                    self.max_retries,
+                )
+            ]
+        else:
+            p_value = self._create_context_recall_prompt(row)
+            results = await self.llm.generate(
+                p_value,
+                callbacks=callbacks,
+                is_async=is_async,
+                n=self.reproducibility,
+            )
+            results = [
+                results.generations[0][i].text for i in range(self.reproducibility)
+            ]
+
+            answers = [
+                await _output_parser.aparse(text, p_value, self.llm, self.max_retries)
+                for text in results
+            ]
 
         answers = [answer.dicts() for answer in answers if answer is not None]
         if all(answer is None for answer in answers):
@@ -10,11 +10,19 @@ from langchain_core.pydantic_v1 import BaseModel, Field
 
 from ragas.llms.output_parser import RagasoutputParser, get_json_format_instructions
 from ragas.llms.prompt import Prompt
-from ragas.metrics.base import EvaluationMode, MetricWithLLM, ensembler, get_segmenter
+from ragas.metrics.base import (
+    STATEMENTS_ARTIFACT,
+    EvaluationMode,
+    MetricWithLLM,
+    ensembler,
+    get_or_compute_artifact,
+    get_segmenter,
+)
 
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
 
+    from ragas.llms import BaseRagasLLM
     from ragas.llms.prompt import PromptValue
 
 from typing import Any, Protocol
@@ -46,6 +54,29 @@ _statements_output_instructions = get_json_format_instructions(StatementsAnswers
 _statements_output_parser = RagasoutputParser(pydantic_object=StatementsAnswers)
 
 
+async def agenerate_statements(
+    llm: BaseRagasLLM,
+    prompt: PromptValue,
+    callbacks: Callbacks,
+    is_async: bool,
+    max_retries: int = 1,
+) -> t.Optional[StatementsAnswers]:
+    """
+    Break a text down into simpler statements with a `LONG_FORM_ANSWER_PROMPT`
+    prompt. The result is shared by the metrics that score the same row with
+    the same llm and prompt.
+    """
+
+    async def generate() -> t.Optional[StatementsAnswers]:
+        result = await llm.generate(prompt, callbacks=callbacks, is_async=is_async)
+        return await _statements_output_parser.aparse(
+            result.generations[0][0].text, prompt, llm, max_retries
+        )
+
+    key = f"{id(llm)}:{prompt.prompt_str}"
+    return await get_or_compute_artifact(STATEMENTS_ARTIFACT, key, generate)
+
+
 LONG_FORM_ANSWER_PROMPT = Prompt(
     name="long_form_answer",
     output_format_instruction=_statements_output_instructions,
@@ -245,13 +276,8 @@ class Faithfulness(MetricWithLLM):
         assert self.llm is not None, "LLM is not set"
 
         p_value = self._create_statements_prompt(row)
-        statements = await self.llm.generate(
-            p_value,
-            callbacks=callbacks,
-            is_async=is_async,
-        )
-        statements = await _statements_output_parser.aparse(
-            statements.generations[0][0].text, p_value, self.llm, self.max_retries
+        statements = await agenerate_statements(
+            self.llm, p_value, callbacks, is_async, self.max_retries
         )
 
         if statements is None:
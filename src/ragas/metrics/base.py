@@ -12,6 +12,7 @@ import logging
 import typing as t
 from abc import ABC, abstractmethod
 from collections import Counter
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
 
@@ -222,4 +223,92 @@ def is_reproducable(metric: Metric) -> bool:
     return hasattr(metric, "_reproducibility")
 
 
+# names of the intermediate artifacts shared by the metrics
+STATEMENTS_ARTIFACT = "statements"
+EMBEDDING_ARTIFACT = "embedding"
+
+T = t.TypeVar("T")
+
+
+class RowArtifacts:
+    """
+    Intermediate results computed while scoring one row, like the statements
+    generated from the answer or the embedding of a text. Each artifact is
+    computed once and shared by all the metrics of the row that need it, even
+    if they ask for it at the same time.
+
+    Artifacts are identified by their name and a key that must contain
+    everything the result depends on (the model and the prompt for example).
+    """
+
+    def __init__(self):
+        self._artifacts: t.Dict[t.Tuple[str, str], asyncio.Future] = {}
+        # wrapped callables that have not finished yet
+        self._pending = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_compute(
+        self, name: str, key: str, compute: t.Callable[[], t.Awaitable[T]]
+    ) -> T:
+        artifact_key = (name, key)
+        future = self._artifacts.get(artifact_key)
+        if future is None:
+            self.misses += 1
+            future = asyncio.ensure_future(compute())
+            self._artifacts[artifact_key] = future
+
+            def forget_failed(future: asyncio.Future):
+                # failed artifacts are computed again by the next metric
+                if future.cancelled() or future.exception() is not None:
+                    self._artifacts.pop(artifact_key, None)
+
+            future.add_done_callback(forget_failed)
+        else:
+            self.hits += 1
+        # a metric that is cancelled (e.g. past its deadline) must not cancel the
+        # artifact for the other metrics
+        return await asyncio.shield(future)
+
+    def wrap(self, callable: t.Callable) -> t.Callable:
+        """
+        Wrap an async callable so that the artifacts it asks for with
+        `get_or_compute_artifact` are shared through this object. The artifacts
+        are dropped once every wrapped callable has run, so that the jobs that
+        keep a reference to this object do not keep them in memory.
+        """
+        self._pending += 1
+
+        async def callable_with_artifacts(*args, **kwargs):
+            token = _row_artifacts.set(self)
+            try:
+                return await callable(*args, **kwargs)
+            finally:
+                _row_artifacts.reset(token)
+                self._pending -= 1
+                if self._pending <= 0:
+                    self._artifacts.clear()
+
+        return callable_with_artifacts
+
+
+_row_artifacts: ContextVar[t.Optional[RowArtifacts]] = ContextVar(
+    "ragas_row_artifacts", default=None
+)
+
+
+async def get_or_compute_artifact(
+    name: str, key: str, compute: t.Callable[[], t.Awaitable[T]]
+) -> T:
+    """
+    Return the artifact shared by the metrics of the row being scored, computing
+    it with `compute` if it is not there yet. Outside of `evaluate()` it is
+    always computed.
+    """
+    artifacts = _row_artifacts.get()
+    if artifacts is None:
+        return await compute()
+    return await artifacts.get_or_compute(name, key, compute)
+
+
 ensembler = Ensember()
@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 import numpy as np
 from langchain_core.pydantic_v1 import BaseModel
 
+from ragas.llms.batching import PromptBatcher, get_prompt_batcher
 from ragas.llms.output_parser import RagasoutputParser, get_json_format_instructions
 from ragas.llms.prompt import Prompt
 from ragas.metrics.base import EvaluationMode, MetricWithLLM
@@ -69,6 +70,10 @@ class AspectCritique(MetricWithLLM):
         made using majority vote.
     llm : LangchainLLM
         llm API of your choice
+    batch_size: int
+        Opt-in batch mode, the rows scored at the same time are sent to the llm
+        in prompts of up to `batch_size` rows. Batched prompts get a single
+        verdict per row, so it can not be combined with a `strictness` above 1.
     """
 
     name: str = field(default="", repr=True)  # type: ignore
@@ -81,6 +86,8 @@ class AspectCritique(MetricWithLLM):
         repr=False,
     )
     max_retries: int = 1
+    batch_size: int = 1
+    _batcher: t.Optional[PromptBatcher] = field(default=None, init=False, repr=False)
 
     def __post_init__(self: t.Self):
         if self.name == "":
@@ -92,19 +99,29 @@ class AspectCritique(MetricWithLLM):
         self.strictness = (
             self.strictness if self.strictness % 2 != 0 else self.strictness + 1
         )
+        if self.batch_size > 1 and self.strictness > 1:
+            raise ValueError("batch_size > 1 can not be used with strictness > 1")
 
-    def prompt_format(
+    def _prompt_inputs(
         self: t.Self,
         question: str,
         answer: str,
         context: t.Optional[str | list[str]] = None,
-    ):
+    ) -> t.Dict[str, t.Any]:
         if context is not None:
             if isinstance(context, list):
                 context = "\n".join(context)
             question = f"{question } answer using context: {context}"
+        return {"input": question, "submission": answer, "criteria": self.definition}
+
+    def prompt_format(
+        self: t.Self,
+        question: str,
+        answer: str,
+        context: t.Optional[str | list[str]] = None,
+    ):
         return self.critic_prompt.format(
-            input=question, submission=answer, criteria=self.definition
+            **self._prompt_inputs(question, answer, context)
         )
 
     def _compute_score(self, safe_loaded_responses: t.List[CriticClassification]):
@@ -124,6 +141,19 @@ class AspectCritique(MetricWithLLM):
 
         q, c, a = row["question"], row["contexts"], row["answer"]
 
+        if self.batch_size > 1:
+            self._batcher = get_prompt_batcher(
+                self._batcher, self.critic_prompt, _output_parser, self.batch_size
+            )
+            response = await self._batcher.agenerate(
+                self.llm,
+                self._prompt_inputs(q, a, c),
+                callbacks,
+                is_async,
+                self.max_retries,
+            )
+            return np.nan if response is None else self._compute_score([response])
+
         p_value = self.prompt_format(q, a, c)
         result = await self.llm.generate(
             p_value, callbacks=callbacks, is_async=is_async
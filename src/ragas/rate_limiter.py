@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing as t
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough number of tokens in a text, about 4 characters per token for english.
+    """
+    return len(text) // 4 + 1
+
+
+class _Bucket:
+    def __init__(self, per_minute: float, burst_seconds: float):
+        self.rate = per_minute / 60
+        self.capacity = max(self.rate * burst_seconds, 1.0)
+        self.level = self.capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        Take `amount` out of the bucket and return the seconds to wait until it
+        is actually available. The level can go negative so that callers are
+        served in the order they asked.
+        """
+        self.level = min(
+            self.capacity, self.level + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+        self.level -= amount
+        return max(0.0, -self.level / self.rate)
+
+
+class RateLimiter:
+    """
+    Token bucket for requests per minute and tokens per minute budgets. It is
+    thread safe so that it can be shared by the event loops of different
+    executors.
+
+    Attributes
+    ----------
+    requests_per_minute: int, optional
+        Number of requests allowed per minute, no limit if None.
+    tokens_per_minute: int, optional
+        Number of tokens allowed per minute, no limit if None.
+    burst_seconds: float
+        How many seconds worth of budget can be used at once after being idle.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: t.Optional[int] = None,
+        tokens_per_minute: t.Optional[int] = None,
+        burst_seconds: float = 10.0,
+    ):
+        self.requests = (
+            _Bucket(requests_per_minute, burst_seconds) if requests_per_minute else None
+        )
+        self.tokens = (
+            _Bucket(tokens_per_minute, burst_seconds) if tokens_per_minute else None
+        )
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self.requests is not None:
+                wait = max(wait, self.requests.reserve(1, now))
+            if self.tokens is not None:
+                wait = max(wait, self.tokens.reserve(tokens, now))
+            return wait
+
+    def acquire(self, tokens: int = 0):
+        """Block until a request using `tokens` tokens fits in the budget."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0):
+        """Wait until a request using `tokens` tokens fits in the budget."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def adjust(self, tokens: int):
+        """
+        Correct the token estimate of a finished request with the actual usage,
+        `tokens` is the difference and can be negative.
+        """
+        if self.tokens is None:
+            return
+        with self._lock:
+            self.tokens.reserve(tokens, time.monotonic())
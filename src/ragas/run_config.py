@@ -1,6 +1,7 @@
+import copy
 import logging
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 
 from tenacity import (
     AsyncRetrying,
@@ -13,11 +14,26 @@ from tenacity import (
 )
 from tenacity.after import after_nothing
 
+from ragas.rate_limiter import RateLimiter
+
 
 @dataclass
 class RunConfig:
     """
     Configuration for a timeouts and retries.
+
+    `requests_per_minute` and `tokens_per_minute` set the budget of each model
+    (LLM or embeddings) that uses this config, calls wait until they fit in it
+    instead of hitting the provider rate limits.
+
+    With `adaptive_concurrency` the executor starts `max_workers` jobs at once
+    and then adapts that number (up to `max_adaptive_workers`) to the latency
+    and the timeout and rate limit errors of the jobs.
+
+    `job_timeout` is the deadline in seconds of each executor job (for example
+    scoring one row with one metric), jobs that miss it are recorded as NaN.
+    Unlike `timeout` it also applies to LLMs that do not support a request
+    timeout.
     """
 
     timeout: int = 60
@@ -29,6 +45,42 @@ class RunConfig:
         t.Tuple[t.Type[BaseException], ...],
     ] = (Exception,)
     log_tenacity: bool = False
+    requests_per_minute: t.Optional[int] = None
+    tokens_per_minute: t.Optional[int] = None
+    adaptive_concurrency: bool = False
+    max_adaptive_workers: int = 256
+    job_timeout: t.Optional[float] = None
+    _rate_limiters: t.Dict[str, RateLimiter] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def get_rate_limiter(self, model: str) -> t.Optional[RateLimiter]:
+        """
+        Return the rate limiter shared by all the calls to `model`, or None if no
+        budget is set.
+        """
+        if self.requests_per_minute is None and self.tokens_per_minute is None:
+            return None
+        limiter = self._rate_limiters.get(model)
+        if limiter is None:
+            limiter = self._rate_limiters.setdefault(
+                model,
+                RateLimiter(
+                    requests_per_minute=self.requests_per_minute,
+                    tokens_per_minute=self.tokens_per_minute,
+                ),
+            )
+        return limiter
+
+    def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> "RunConfig":
+        # the rate limiters hold locks that can not be copied, the copies share
+        # them so that they also share the budget of each model
+        copied = copy.copy(self)
+        memo[id(self)] = copied
+        for f in fields(self):
+            if f.name != "_rate_limiters":
+                setattr(copied, f.name, copy.deepcopy(getattr(self, f.name), memo))
+        return copied
 
 
 def add_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
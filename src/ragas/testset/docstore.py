@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import heapq
+import json
 import logging
+import os
 import typing as t
 import uuid
 from abc import ABC, abstractmethod
@@ -18,6 +19,14 @@ from ragas.embeddings.base import BaseRagasEmbeddings
 from ragas.exceptions import ExceptionInRunner
 from ragas.executor import Executor
 from ragas.run_config import RunConfig
+from ragas.testset.similarity_index import (
+    Embedding,
+    ExactIndex,
+    SimilarityIndex,
+    get_top_k_normalized,
+    normalize_embeddings,
+    recall_at_k,
+)
 from ragas.testset.utils import rng
 
 if t.TYPE_CHECKING:
@@ -25,7 +34,6 @@ if t.TYPE_CHECKING:
 
     from ragas.testset.extractor import Extractor
 
-Embedding = t.Union[t.List[float], npt.NDArray[np.float64]]
 logger = logging.getLogger(__name__)
 
 
@@ -169,18 +177,31 @@ def get_top_k_embeddings(
         embedding_ids = list(range(len(embeddings)))
 
     similarity_fn = similarity_fn or default_similarity_fns
+    if similarity_fn is similarity:
+        scores, indices = get_top_k_normalized(
+            query_embedding,
+            normalize_embeddings(embeddings),
+            similarity_top_k=similarity_top_k,
+            similarity_cutoff=similarity_cutoff,
+        )
+        return scores, [embedding_ids[i] for i in indices]
 
-    embeddings_np = np.array(embeddings)
     query_embedding_np = np.array(query_embedding)
-
-    similarity_heap: t.List[t.Tuple[float, t.Any]] = []
-    for i, emb in enumerate(embeddings_np):
-        similarity = similarity_fn(query_embedding_np, emb)
-        if similarity_cutoff is None or similarity > similarity_cutoff:
-            heapq.heappush(similarity_heap, (similarity, embedding_ids[i]))
-            if similarity_top_k and len(similarity_heap) > similarity_top_k:
-                heapq.heappop(similarity_heap)
-    result_tups = sorted(similarity_heap, key=lambda x: x[0], reverse=True)
+    scored = [
+        (similarity_fn(query_embedding_np, np.array(emb)), embedding_ids[i])
+        for i, emb in enumerate(embeddings)
+    ]
+    result_tups = sorted(
+        (
+            (score, id)
+            for score, id in scored
+            if similarity_cutoff is None or score > similarity_cutoff
+        ),
+        key=lambda x: x[0],
+        reverse=True,
+    )
+    if similarity_top_k:
+        result_tups = result_tups[:similarity_top_k]
 
     result_similarities = [s for s, _ in result_tups]
     result_ids = [n for _, n in result_tups]
@@ -188,6 +209,103 @@ def get_top_k_embeddings(
     return result_similarities, result_ids
 
 
+class _NormalizedEmbeddings:
+    """
+    Growable contiguous matrix of normalized embeddings. Rows are kept in a
+    buffer that doubles when it is full so that adding nodes does not copy
+    the whole matrix every time.
+    """
+
+    def __init__(self):
+        self._buffer: npt.NDArray[np.float32] = np.empty((0, 0), dtype=np.float32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def matrix(self) -> npt.NDArray[np.float32]:
+        return self._buffer[: self._size]
+
+    def extend(
+        self, embeddings: t.Union[t.Sequence[Embedding], npt.NDArray[np.float32]]
+    ):
+        if len(embeddings) == 0:
+            return
+        rows = normalize_embeddings(embeddings)
+        size = self._size + len(rows)
+        if size > len(self._buffer):
+            buffer = np.empty(
+                (max(size, 2 * len(self._buffer)), rows.shape[1]), dtype=np.float32
+            )
+            if self._size > 0:
+                buffer[: self._size] = self.matrix
+            self._buffer = buffer
+        self._buffer[self._size : size] = rows
+        self._size = size
+
+
+class _FileEmbeddings:
+    """
+    Running sum of the embeddings of the nodes of each file, used for the
+    similarity of a node with its document. The sum points in the same
+    direction as the mean, so it gives the same cosine similarity.
+    """
+
+    def __init__(self):
+        self.file_ids: t.Dict[str, int] = {}
+        self.sums: npt.NDArray[np.float64] = np.zeros((0, 0))
+        self.counts: npt.NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        # the file of every node added so far
+        self.node_files: npt.NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.node_files)
+
+    def add(
+        self, filenames: t.Sequence[str], embeddings: t.Sequence[Embedding]
+    ) -> npt.NDArray[np.int64]:
+        """Add the nodes to the sums of their files, returns the files touched."""
+        files = np.array(
+            [self.file_ids.setdefault(f, len(self.file_ids)) for f in filenames],
+            dtype=np.int64,
+        )
+        rows = np.asarray(embeddings, dtype=np.float64).reshape(len(files), -1)
+        num_new_files = len(self.file_ids) - len(self.counts)
+        self.sums = np.concatenate(
+            [
+                self.sums.reshape(len(self.counts), rows.shape[1]),
+                np.zeros((num_new_files, rows.shape[1])),
+            ]
+        )
+        self.counts = np.concatenate(
+            [self.counts, np.zeros(num_new_files, dtype=np.int64)]
+        )
+        np.add.at(self.sums, files, rows)
+        np.add.at(self.counts, files, 1)
+        self.node_files = np.concatenate([self.node_files, files])
+        return np.unique(files)
+
+    def doc_similarity(
+        self,
+        normalized_embeddings: npt.NDArray[np.float32],
+        files: npt.NDArray[np.int64],
+    ) -> t.Tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        """
+        Similarity of the nodes of `files` with the mean embedding of their file.
+        Returns the node indices and their similarities.
+        """
+        nodes = np.flatnonzero(np.isin(self.node_files, files))
+        node_files = self.node_files[nodes]
+        sums = self.sums[node_files]
+        norms = np.linalg.norm(sums, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarities = (normalized_embeddings[nodes] * sums).sum(axis=1) / norms
+        # a file with a single node is its own document
+        similarities[self.counts[node_files] == 1] = 1.0
+        return nodes, similarities
+
+
 @dataclass
 class InMemoryDocumentStore(DocumentStore):
     splitter: TextSplitter
@@ -197,6 +315,25 @@ class InMemoryDocumentStore(DocumentStore):
     node_embeddings_list: t.List[Embedding] = field(default_factory=list)
     node_map: t.Dict[str, Node] = field(default_factory=dict)
     run_config: t.Optional[RunConfig] = None
+    similarity_index: SimilarityIndex = field(default_factory=ExactIndex, repr=False)
+    _normalized_embeddings: _NormalizedEmbeddings = field(
+        default_factory=_NormalizedEmbeddings, init=False, repr=False
+    )
+    _embeddings_source: t.Optional[t.List[Embedding]] = field(
+        default=None, init=False, repr=False
+    )
+    _wins: npt.NDArray[np.int64] = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int64), init=False, repr=False
+    )
+    _doc_similarity: npt.NDArray[np.float64] = field(
+        default_factory=lambda: np.zeros(0), init=False, repr=False
+    )
+    _nodes_source: t.Optional[t.List[Node]] = field(
+        default=None, init=False, repr=False
+    )
+    _file_embeddings: _FileEmbeddings = field(
+        default_factory=_FileEmbeddings, init=False, repr=False
+    )
 
     def _embed_items(self, items: t.Union[t.Sequence[Document], t.Sequence[Node]]):
         ...
@@ -268,9 +405,53 @@ class InMemoryDocumentStore(DocumentStore):
                 ), "Embedding must be list or np.ndarray"
                 self.node_embeddings_list.append(n.embedding)
 
+        self.get_embedding_matrix()
         self.calculate_nodes_docs_similarity()
         self.set_node_relataionships()
 
+    def get_embedding_matrix(self) -> npt.NDArray[np.float32]:
+        """
+        The normalized embeddings of the nodes as a float32 matrix, one row per
+        entry of `node_embeddings_list`. New entries are appended to the matrix,
+        it is only rebuilt when the list is replaced.
+        """
+        if self._embeddings_source is not self.node_embeddings_list or len(
+            self._normalized_embeddings
+        ) > len(self.node_embeddings_list):
+            self._normalized_embeddings = _NormalizedEmbeddings()
+            self._embeddings_source = self.node_embeddings_list
+            self.similarity_index.reset()
+        self._normalized_embeddings.extend(
+            self.node_embeddings_list[len(self._normalized_embeddings) :]
+        )
+        return self._normalized_embeddings.matrix
+
+    def _sync_node_arrays(self):
+        """
+        Keep `_wins` and `_doc_similarity` parallel to `nodes`. The values of the
+        nodes appended since the last call are added, the arrays are rebuilt
+        when `nodes` is replaced.
+        """
+        start = len(self._wins)
+        if self._nodes_source is not self.nodes or start > len(self.nodes):
+            self._nodes_source = self.nodes
+            self._wins = np.zeros(0, dtype=np.int64)
+            self._doc_similarity = np.zeros(0)
+            self._file_embeddings = _FileEmbeddings()
+            start = 0
+        new_nodes = self.nodes[start:]
+        if not new_nodes:
+            return
+        self._wins = np.concatenate(
+            [self._wins, np.array([n.wins for n in new_nodes], dtype=np.int64)]
+        )
+        self._doc_similarity = np.concatenate(
+            [
+                self._doc_similarity,
+                np.array([n.doc_similarity for n in new_nodes], dtype=np.float64),
+            ]
+        )
+
     def set_node_relataionships(self):
         for i, node in enumerate(self.nodes):
             if i > 0:
@@ -285,30 +466,36 @@ class InMemoryDocumentStore(DocumentStore):
                 node.relationships[Direction.NEXT] = None
 
     def calculate_nodes_docs_similarity(self):
-        doc_embeddings = {}
-        filename_ids = set(
-            [node.filename for node in self.nodes if node.filename is not None]
+        """
+        Set the similarity of the nodes with the mean embedding of their file.
+        Only the nodes of the files that got new nodes since the last call are
+        updated.
+        """
+        self._sync_node_arrays()
+        new_nodes = self.nodes[len(self._file_embeddings) :]
+        if not new_nodes:
+            return
+        embeddings = self.get_embedding_matrix()
+        assert len(embeddings) == len(
+            self.nodes
+        ), "node_embeddings_list must have one embedding per node"
+
+        new_embeddings = [
+            node.embedding for node in new_nodes if node.embedding is not None
+        ]
+        assert len(new_embeddings) == len(new_nodes), "all nodes must have embeddings"
+        touched_files = self._file_embeddings.add(
+            [node.filename for node in new_nodes], new_embeddings
         )
-        node_ids = set([node.doc_id for node in self.nodes])
-
-        if len(filename_ids) == len(node_ids):
+        if len(self._file_embeddings.file_ids) == len(self.nodes):
             logger.warning("Filename and doc_id are the same for all nodes.")
-            for node in self.nodes:
-                node.doc_similarity = 1.0
-
-        else:
-            for file_id in filename_ids:
-                nodes_embedding = np.array(
-                    [node.embedding for node in self.nodes if node.filename == file_id]
-                )
-                nodes_embedding = nodes_embedding.reshape(len(nodes_embedding), -1)
-                doc_embeddings[file_id] = np.mean(nodes_embedding, axis=0)
 
-            for node in self.nodes:
-                assert node.embedding is not None, "Embedding cannot be None"
-                node.doc_similarity = similarity(
-                    node.embedding, doc_embeddings[node.filename]
-                )
+        indices, similarities = self._file_embeddings.doc_similarity(
+            embeddings, touched_files
+        )
+        self._doc_similarity[indices] = similarities
+        for i, doc_similarity in zip(indices.tolist(), similarities.tolist()):
+            self.nodes[i].doc_similarity = doc_similarity
 
     def get_node(self, node_id: str) -> Node:
         return self.node_map[node_id]
@@ -317,19 +504,15 @@ class InMemoryDocumentStore(DocumentStore):
         raise NotImplementedError
 
     def get_random_nodes(self, k=1, alpha=0.1) -> t.List[Node]:
-        def adjustment_factor(wins, alpha):
-            return np.exp(-alpha * wins)
-
-        scores = [adjustment_factor(node.wins, alpha) for node in self.nodes]
-        similarity_scores = [node.doc_similarity for node in self.nodes]
-        prob = np.array(scores) * np.array(similarity_scores)
+        self._sync_node_arrays()
+        prob = np.exp(-alpha * self._wins) * self._doc_similarity
         prob = prob / np.sum(prob)
 
-        nodes = rng.choice(np.array(self.nodes), size=k, p=prob).tolist()
-
+        indices = rng.choice(len(self.nodes), size=k, p=prob)
+        np.add.at(self._wins, indices, 1)
+        nodes = [self.nodes[i] for i in indices]
         for node in nodes:
-            idx = self.nodes.index(node)
-            self.nodes[idx].wins += 1
+            node.wins += 1
 
         return nodes
 
@@ -339,19 +522,134 @@ class InMemoryDocumentStore(DocumentStore):
         doc = node
         if doc.embedding is None:
             raise ValueError("Document has no embedding.")
-        scores, doc_ids = get_top_k_embeddings(
-            query_embedding=doc.embedding,
-            embeddings=self.node_embeddings_list,
-            similarity_fn=similarity,
-            similarity_cutoff=threshold,
+        self.similarity_index.update(self.get_embedding_matrix())
+        scores, doc_ids = self.similarity_index.search(
+            doc.embedding,
+            cutoff=threshold,
             # we need to return k+1 docs here as the top result is the input doc itself
-            similarity_top_k=top_k + 1,
+            top_k=top_k + 1,
         )
         # remove the query doc itself from results
         scores, doc_ids = scores[1:], doc_ids[1:]
         items = [self.nodes[doc_id] for doc_id in doc_ids]
         return items
 
+    def save(self, path: str):
+        """
+        Save the nodes to the directory `path` so that a later run can `load`
+        them without splitting, embedding and extracting keyphrases again.
+
+        The directory holds `nodes.json` (the doc_id, page_content, metadata and
+        keyphrases of the nodes, one list per field), `embeddings.f32` (the
+        embeddings as the rows of a float32 matrix) and `meta.json` (the number
+        of nodes and the embedding dimension), written last.
+
+        Raises ValueError if the metadata of a node can not be saved as JSON.
+        """
+        assert len(self.nodes) == len(
+            self.node_embeddings_list
+        ), "node_embeddings_list must have one embedding per node"
+        # checked before anything is written so that a failed save leaves the
+        # directory as it was
+        for node in self.nodes:
+            try:
+                json.dumps(node.metadata)
+            except (TypeError, ValueError) as e:
+                raise ValueError(
+                    f"Metadata of node {node.doc_id} is not JSON serializable: {e}"
+                ) from e
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        columns = {
+            "doc_id": [node.doc_id for node in self.nodes],
+            "page_content": [node.page_content for node in self.nodes],
+            "metadata": [node.metadata for node in self.nodes],
+            "keyphrases": [node.keyphrases for node in self.nodes],
+        }
+        with open(os.path.join(path, "nodes.json"), "w", encoding="utf8") as f:
+            json.dump(columns, f, ensure_ascii=False)
+
+        dim = 0
+        with open(os.path.join(path, "embeddings.f32"), "wb") as f:
+            # in chunks so that the whole corpus is not copied at once
+            chunk_size = 4096
+            for i in range(0, len(self.node_embeddings_list), chunk_size):
+                chunk = self.node_embeddings_list[i : i + chunk_size]
+                rows = np.asarray(chunk, dtype=np.float32).reshape(len(chunk), -1)
+                dim = rows.shape[1]
+                f.write(rows.tobytes())
+
+        with open(meta_path, "w") as f:
+            json.dump({"num_nodes": len(self.nodes), "dim": dim}, f)
+
+    def load(self, path: str):
+        """
+        Add the nodes saved with `save` to the docstore. The embeddings are
+        memory-mapped, the embedding of each node is a read-only row of it.
+        """
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.exists(meta_path):
+            raise ValueError(f"No docstore was saved in {path}")
+        with open(meta_path) as f:
+            meta = json.load(f)
+        num_nodes, dim = meta["num_nodes"], meta["dim"]
+        with open(os.path.join(path, "nodes.json"), encoding="utf8") as f:
+            columns = json.load(f)
+        if num_nodes == 0:
+            return
+        embeddings_path = os.path.join(path, "embeddings.f32")
+        if os.path.getsize(embeddings_path) != num_nodes * dim * 4:
+            raise ValueError(f"Embeddings in {path} do not match the saved nodes")
+
+        embeddings = np.memmap(
+            embeddings_path, dtype=np.float32, mode="r", shape=(num_nodes, dim)
+        )
+        # the fields were validated when the nodes were saved
+        nodes = [
+            Node.construct(
+                doc_id=doc_id,
+                page_content=page_content,
+                metadata=metadata,
+                keyphrases=keyphrases,
+                embedding=embedding,
+            )
+            for doc_id, page_content, metadata, keyphrases, embedding in zip(
+                columns["doc_id"],
+                columns["page_content"],
+                columns["metadata"],
+                columns["keyphrases"],
+                embeddings,
+            )
+        ]
+        # normalize the memory-mapped matrix at once instead of row by row
+        self.get_embedding_matrix()
+        self._normalized_embeddings.extend(embeddings)
+        self.node_embeddings_list.extend(embeddings)
+        self.nodes.extend(nodes)
+        self.node_map.update((node.doc_id, node) for node in nodes)
+
+        self.calculate_nodes_docs_similarity()
+        self.set_node_relataionships()
+
+    def similarity_recall(self, top_k: int = 3, num_queries: int = 100) -> float:
+        """
+        Recall of `similarity_index` against exact search: the fraction of the
+        exact `top_k` most similar nodes it returns for `num_queries` nodes.
+        """
+        embeddings = self.get_embedding_matrix()
+        self.similarity_index.update(embeddings)
+        recall = recall_at_k(self.similarity_index, embeddings, top_k, num_queries)
+        logger.info(
+            "recall@%s of %s: %.3f",
+            top_k,
+            self.similarity_index.__class__.__name__,
+            recall,
+        )
+        return recall
+
     def set_run_config(self, run_config: RunConfig):
         if self.embeddings:
             self.embeddings.set_run_config(run_config)
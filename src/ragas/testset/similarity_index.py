@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import logging
+import typing as t
+from abc import ABC, abstractmethod
+
+import numpy as np
+import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+Embedding = t.Union[t.List[float], npt.NDArray[np.float64], npt.NDArray[np.float32]]
+
+
+def normalize_embeddings(
+    embeddings: t.Union[t.Sequence[Embedding], npt.NDArray[np.float32]],
+) -> npt.NDArray[np.float32]:
+    """
+    Embeddings, a sequence or a 2d array, as the rows of a float32 matrix
+    scaled to unit norm, so that the cosine similarity is a dot product. Rows
+    with a zero norm are NaN, like their cosine similarity.
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    out = np.full_like(matrix, np.nan)
+    return np.divide(matrix, norms, out=out, where=norms > 0)
+
+
+def get_top_k_normalized(
+    query_embedding: Embedding,
+    normalized_embeddings: npt.NDArray[np.float32],
+    similarity_top_k: t.Optional[int] = None,
+    similarity_cutoff: t.Optional[float] = None,
+) -> t.Tuple[t.List[float], t.List[int]]:
+    """
+    Cosine top k against embeddings from `normalize_embeddings`.
+    returns the scores and the row indices of the embeddings
+    """
+    query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+    norm = np.linalg.norm(query)
+    if len(normalized_embeddings) == 0 or norm == 0:
+        return [], []
+
+    scores = normalized_embeddings @ (query / norm)
+    if similarity_cutoff is None:
+        candidates = np.flatnonzero(~np.isnan(scores))
+    else:
+        candidates = np.flatnonzero(scores > similarity_cutoff)
+    if similarity_top_k and len(candidates) > similarity_top_k:
+        top = np.argpartition(-scores[candidates], similarity_top_k - 1)
+        candidates = candidates[top[:similarity_top_k]]
+    candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return scores[candidates].tolist(), candidates.tolist()
+
+
+class SimilarityIndex(ABC):
+    """
+    Index over the normalized embeddings of a docstore that answers cosine top
+    k queries. The docstore passes its whole embedding matrix to `update`, only
+    the rows that were not indexed yet are added.
+    """
+
+    def __init__(self):
+        self.size = 0
+
+    def update(self, embeddings: npt.NDArray[np.float32]):
+        if len(embeddings) < self.size:
+            self.reset()
+        if len(embeddings) > self.size:
+            self._add(embeddings, self.size)
+            self.size = len(embeddings)
+
+    def reset(self):
+        """Forget every indexed row, the next `update` indexes all of them."""
+        self.size = 0
+
+    @abstractmethod
+    def _add(self, embeddings: npt.NDArray[np.float32], start: int):
+        """Index the rows of `embeddings` from `start` on."""
+        ...
+
+    @abstractmethod
+    def search(
+        self,
+        query_embedding: Embedding,
+        top_k: t.Optional[int] = None,
+        cutoff: t.Optional[float] = None,
+    ) -> t.Tuple[t.List[float], t.List[int]]:
+        """Scores and row indices of the most similar embeddings, best first."""
+        ...
+
+
+class ExactIndex(SimilarityIndex):
+    """Brute force search, the similarity of every row is computed."""
+
+    def __init__(self):
+        super().__init__()
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+
+    def reset(self):
+        super().reset()
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+
+    def _add(self, embeddings: npt.NDArray[np.float32], start: int):
+        self._embeddings = embeddings
+
+    def search(
+        self,
+        query_embedding: Embedding,
+        top_k: t.Optional[int] = None,
+        cutoff: t.Optional[float] = None,
+    ) -> t.Tuple[t.List[float], t.List[int]]:
+        return get_top_k_normalized(
+            query_embedding,
+            self._embeddings[: self.size],
+            similarity_top_k=top_k,
+            similarity_cutoff=cutoff,
+        )
+
+
+class IVFIndex(SimilarityIndex):
+    """
+    Inverted file index in pure NumPy. The embeddings are clustered with
+    spherical k-means and a query is only compared with the rows of the
+    `num_probes` clusters whose centroids are the most similar to it.
+
+    Rows added after training are assigned to the nearest centroid, the
+    clusters are trained again once the number of rows has doubled.
+
+    Attributes
+    ----------
+    num_lists: int, optional
+        Number of clusters, the square root of the number of rows if None.
+    num_probes: int
+        Number of clusters searched for each query, more is slower and more
+        accurate.
+    min_size: int
+        Below this number of rows the search is exact.
+    iterations: int
+        Number of k-means iterations.
+    seed: int
+        Seed of the k-means initialization.
+    """
+
+    def __init__(
+        self,
+        num_lists: t.Optional[int] = None,
+        num_probes: int = 8,
+        min_size: int = 1000,
+        iterations: int = 10,
+        seed: int = 42,
+    ):
+        super().__init__()
+        self.num_lists = num_lists
+        self.num_probes = num_probes
+        self.min_size = min_size
+        self.iterations = iterations
+        self.seed = seed
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+        self._centroids: t.Optional[npt.NDArray[np.float32]] = None
+        self._lists: t.List[npt.NDArray[np.int64]] = []
+        self._trained_size = 0
+
+    def _assign(self, rows: npt.NDArray[np.float32]) -> npt.NDArray[np.int64]:
+        assert self._centroids is not None
+        assignments = np.empty(len(rows), dtype=np.int64)
+        # in chunks so that the rows x centroids matrix stays small
+        chunk_size = 16384
+        for i in range(0, len(rows), chunk_size):
+            scores = rows[i : i + chunk_size] @ self._centroids.T
+            assignments[i : i + chunk_size] = np.argmax(scores, axis=1)
+        return assignments
+
+    def _train(self, embeddings: npt.NDArray[np.float32]):
+        valid = np.flatnonzero(~np.isnan(embeddings[:, 0]))
+        if len(valid) == 0:
+            return
+        num_lists = self.num_lists or max(1, int(np.sqrt(len(valid))))
+        num_lists = min(num_lists, len(valid))
+        gen = np.random.default_rng(self.seed)
+        # k-means on a sample is enough to place the centroids
+        sample = embeddings[
+            gen.choice(valid, size=min(len(valid), 256 * num_lists), replace=False)
+        ]
+        centroids = sample[gen.choice(len(sample), size=num_lists, replace=False)]
+        for _ in range(self.iterations):
+            self._centroids = centroids
+            assignments = self._assign(sample)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # empty clusters keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+        self._centroids = centroids.astype(np.float32)
+        self._lists = [np.empty(0, dtype=np.int64) for _ in range(num_lists)]
+        self._trained_size = len(embeddings)
+        self._add_to_lists(embeddings, valid)
+
+    def _add_to_lists(
+        self, embeddings: npt.NDArray[np.float32], rows: npt.NDArray[np.int64]
+    ):
+        assignments = self._assign(embeddings[rows])
+        order = np.argsort(assignments, kind="stable")
+        lists, starts = np.unique(assignments[order], return_index=True)
+        for list_id, group in zip(lists, np.split(rows[order], starts[1:])):
+            self._lists[list_id] = np.concatenate([self._lists[list_id], group])
+
+    def _add(self, embeddings: npt.NDArray[np.float32], start: int):
+        self._embeddings = embeddings
+        if len(embeddings) < self.min_size:
+            return
+        if self._centroids is None or len(embeddings) >= 2 * self._trained_size:
+            self._train(embeddings)
+            return
+        new_rows = np.arange(start, len(embeddings))
+        new_rows = new_rows[~np.isnan(embeddings[new_rows, 0])]
+        if len(new_rows) > 0:
+            self._add_to_lists(embeddings, new_rows)
+
+    def search(
+        self,
+        query_embedding: Embedding,
+        top_k: t.Optional[int] = None,
+        cutoff: t.Optional[float] = None,
+    ) -> t.Tuple[t.List[float], t.List[int]]:
+        embeddings = self._embeddings[: self.size]
+        if self._centroids is None:
+            return get_top_k_normalized(query_embedding, embeddings, top_k, cutoff)
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        num_probes = min(self.num_probes, len(self._centroids))
+        probes = np.argpartition(-(self._centroids @ query), num_probes - 1)
+        candidates = np.concatenate([self._lists[p] for p in probes[:num_probes]])
+        scores, indices = get_top_k_normalized(
+            query, embeddings[candidates], top_k, cutoff
+        )
+        return scores, candidates[indices].tolist()
+
+
+class HnswlibIndex(SimilarityIndex):
+    """
+    Approximate search with a HNSW graph from the optional `hnswlib` package
+    (`pip install hnswlib`).
+
+    Attributes
+    ----------
+    M: int
+        Number of neighbours of each node in the graph.
+    ef_construction: int
+        Size of the candidate list while building the graph.
+    ef: int
+        Size of the candidate list while searching, more is slower and more
+        accurate. It is raised to `top_k` when needed.
+    """
+
+    def __init__(self, M: int = 16, ef_construction: int = 200, ef: int = 64):
+        try:
+            import hnswlib
+        except ImportError as exc:
+            raise ImportError(
+                "Could not import hnswlib python package. "
+                "Please install it with `pip install hnswlib`."
+            ) from exc
+
+        super().__init__()
+        self._hnswlib = hnswlib
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef = ef
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._index = None
+        self._count = 0
+
+    def _add(self, embeddings: npt.NDArray[np.float32], start: int):
+        rows = np.arange(start, len(embeddings))
+        # zero embeddings have no similarity with anything
+        rows = rows[~np.isnan(embeddings[rows, 0])]
+        if len(rows) == 0:
+            return
+        if self._index is None:
+            self._index = self._hnswlib.Index(space="ip", dim=embeddings.shape[1])
+            self._index.init_index(
+                max_elements=max(2 * len(rows), 1024),
+                ef_construction=self.ef_construction,
+                M=self.M,
+            )
+        elif self._count + len(rows) > self._index.get_max_elements():
+            self._index.resize_index(2 * (self._count + len(rows)))
+        self._index.add_items(embeddings[rows], rows)
+        self._count += len(rows)
+
+    def search(
+        self,
+        query_embedding: Embedding,
+        top_k: t.Optional[int] = None,
+        cutoff: t.Optional[float] = None,
+    ) -> t.Tuple[t.List[float], t.List[int]]:
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        if self._index is None or norm == 0:
+            return [], []
+
+        k = min(top_k or self._count, self._count)
+        self._index.set_ef(max(self.ef, k))
+        labels, distances = self._index.knn_query(query / norm, k=k)
+        # the inner product space returns 1 - similarity
+        scores = 1.0 - distances[0]
+        keep = scores > cutoff if cutoff is not None else np.ones(k, dtype=bool)
+        return scores[keep].tolist(), labels[0][keep].astype(int).tolist()
+
+
+def recall_at_k(
+    index: SimilarityIndex,
+    embeddings: npt.NDArray[np.float32],
+    top_k: int = 3,
+    num_queries: int = 100,
+    seed: int = 0,
+) -> float:
+    """
+    Fraction of the exact top k neighbours that the index returns, averaged
+    over `num_queries` rows of `embeddings` used as queries. The index must
+    have been updated with `embeddings`.
+    """
+    valid = np.flatnonzero(~np.isnan(embeddings[:, 0])) if len(embeddings) else []
+    if len(valid) == 0:
+        return 1.0
+    gen = np.random.default_rng(seed)
+    queries = gen.choice(valid, size=min(num_queries, len(valid)), replace=False)
+
+    recalls = []
+    for row in queries:
+        _, exact = get_top_k_normalized(embeddings[row], embeddings, top_k)
+        _, approximate = index.search(embeddings[row], top_k)
+        recalls.append(len(set(exact) & set(approximate)) / len(exact))
+    return float(np.mean(recalls))
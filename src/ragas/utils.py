@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import typing as t
@@ -14,6 +15,23 @@ if t.TYPE_CHECKING:
 
 DEBUG_ENV_VAR = "RAGAS_DEBUG"
 
+# settings that tell apart differently configured models of the same class
+MODEL_IDENTITY_ATTRIBUTES = (
+    "model",
+    "model_name",
+    "deployment",
+    "deployment_name",
+    "dimensions",
+    "temperature",
+    "model_kwargs",
+    "base_url",
+    "openai_api_base",
+    "openai_api_version",
+    "azure_endpoint",
+    "endpoint_url",
+    "api_base",
+)
+
 
 @lru_cache(maxsize=1)
 def get_cache_dir() -> str:
@@ -24,6 +42,24 @@ def get_cache_dir() -> str:
     return os.path.expanduser(os.getenv("RAGAS_CACHE_HOME", default_ragas_cache))
 
 
+def get_model_identity(model: t.Any) -> str:
+    """
+    Identity of a model used to key caches: its class with the
+    `_identifying_params` of langchain models and the model settings in
+    `MODEL_IDENTITY_ATTRIBUTES` that are set. API keys are never part of it.
+    """
+    params: t.Dict[str, t.Any] = {}
+    identifying_params = getattr(model, "_identifying_params", None)
+    if isinstance(identifying_params, t.Mapping):
+        params.update(identifying_params)
+    for name in MODEL_IDENTITY_ATTRIBUTES:
+        value = getattr(model, name, None)
+        if value is not None:
+            params.setdefault(name, value)
+    dumped = json.dumps(params, sort_keys=True, default=str)
+    return f"{model.__class__.__name__}:{dumped}"
+
+
 @lru_cache(maxsize=1)
 def get_debug_mode() -> bool:
     if os.environ.get(DEBUG_ENV_VAR, str(False)).lower() == "true":
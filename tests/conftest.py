@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
 
 import pytest
 from langchain_core.outputs import Generation, LLMResult
 
 from ragas.llms.base import BaseRagasLLM
+from ragas.llms.cache import LLMCache
+from ragas.run_config import RunConfig
 
 if t.TYPE_CHECKING:
     from ragas.llms.prompt import PromptValue
@@ -22,19 +25,58 @@ def pytest_configure(config):
 
 
 class FakeTestLLM(BaseRagasLLM):
+    """
+    LLM for the tests. It answers with `respond(prompt_str)`, the prompt itself
+    by default, and async calls sleep `delay` seconds first. The prompts and
+    callbacks of the calls are recorded, as well as the largest number of async
+    calls running at the same time.
+    """
+
+    def __init__(
+        self,
+        run_config: t.Optional[RunConfig] = None,
+        cache: t.Optional[LLMCache] = None,
+        respond: t.Optional[t.Callable[[str], str]] = None,
+        delay: float = 0.0,
+    ):
+        super().__init__(run_config=run_config or RunConfig(), cache=cache)
+        self.respond = respond
+        self.delay = delay
+        self.prompts: t.List[str] = []
+        self.callbacks: t.List[t.Any] = []
+        self.running = 0
+        self.max_running = 0
+
+    @property
+    def calls(self) -> int:
+        return len(self.prompts)
+
     def llm(self):
         return self
 
     def generate_text(
         self, prompt: PromptValue, n=1, temperature=1e-8, stop=None, callbacks=[]
     ):
-        generations = [[Generation(text=prompt.prompt_str)] * n]
+        self.prompts.append(prompt.prompt_str)
+        self.callbacks.append(callbacks)
+        text = (
+            prompt.prompt_str
+            if self.respond is None
+            else self.respond(prompt.prompt_str)
+        )
+        generations = [[Generation(text=text)] * n]
         return LLMResult(generations=generations)
 
     async def agenerate_text(
         self, prompt: PromptValue, n=1, temperature=1e-8, stop=None, callbacks=[]
     ):
-        return self.generate_text(prompt, n, temperature, stop, callbacks)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.generate_text(prompt, n, temperature, stop, callbacks)
+        finally:
+            self.running -= 1
 
 
 @pytest.fixture
@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import pytest
+
+CLASSIFICATION = [{"statement": "s", "attributed": 1, "reason": "r"}]
+
+
+def respond(prompt_str: str) -> str:
+    if "input 1:" in prompt_str:
+        # the second row of the batch is not valid and has to be retried
+        return json.dumps({"0": CLASSIFICATION, "1": {"bad": "output"}})
+    return json.dumps(CLASSIFICATION)
+
+
+def test_format_batch():
+    from ragas.metrics._context_recall import CONTEXT_RECALL_RA
+
+    inputs = [
+        {"question": f"q{i}", "context": f"c{i}", "answer": f"a{i}"} for i in range(2)
+    ]
+    prompt_str = CONTEXT_RECALL_RA.format_batch(inputs).prompt_str
+
+    assert prompt_str.count(CONTEXT_RECALL_RA.instruction) == 1
+    assert "input 0:\nquestion: q0\ncontext: c0\nanswer: a0" in prompt_str
+    assert "input 1:\nquestion: q1" in prompt_str
+    # the braces of the examples are not escaped
+    assert "{{" not in prompt_str
+
+
+@pytest.mark.asyncio
+async def test_context_recall_batch_mode_falls_back_per_row(fake_llm):
+    from ragas.metrics import ContextRecall
+
+    llm = fake_llm
+    llm.respond = respond
+    metric = ContextRecall(llm=llm, batch_size=4)
+    rows = [
+        {"question": f"q{i}", "contexts": [f"c{i}"], "ground_truth": f"g{i}"}
+        for i in range(2)
+    ]
+    scores = await asyncio.gather(*[metric.ascore(row) for row in rows])
+
+    assert scores == [1.0, 1.0]
+    # one batched prompt and a single-row call for the row that failed to parse
+    assert len(llm.prompts) == 2
+    assert "input 1:" in llm.prompts[0]
+    assert "g1" in llm.prompts[1] and "input 0:" not in llm.prompts[1]
+    batcher = metric._batcher
+    assert batcher is not None
+    assert (batcher.batches, batcher.batched_rows, batcher.fallbacks) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_batched_call_gets_the_callbacks_of_the_first_row(fake_llm):
+    from ragas.llms.batching import PromptBatcher
+    from ragas.metrics._context_recall import CONTEXT_RECALL_RA, _output_parser
+
+    llm = fake_llm
+    llm.respond = respond
+    batcher = PromptBatcher(CONTEXT_RECALL_RA, _output_parser, batch_size=2)
+    callbacks = [["row 0 handler"], ["row 1 handler"]]
+    await asyncio.gather(
+        *[
+            batcher.agenerate(
+                llm,
+                {"question": f"q{i}", "context": f"c{i}", "answer": f"a{i}"},
+                callbacks=callbacks[i],
+            )
+            for i in range(2)
+        ]
+    )
+
+    # the batched call and the fallback of the row that failed to parse
+    assert llm.callbacks == [callbacks[0], callbacks[1]]
+
+
+def test_critique_rejects_batch_mode_with_strictness():
+    from ragas.metrics.critique import AspectCritique
+
+    with pytest.raises(ValueError):
+        AspectCritique(name="n", definition="d", strictness=3, batch_size=4)
+    AspectCritique(name="n", definition="d", batch_size=4)
@@ -0,0 +1,85 @@
+import pytest
+
+from ragas.llms.json_load import json_loader
+
+
+def test_load_all_jsons():
+    text = 'Here you go: {"a": 1} and ```[1, {"b": "c"}]``` and {"d": []}'
+    assert json_loader._load_all_jsons(text) == [{"a": 1}, [1, {"b": "c"}], {"d": []}]
+
+
+def test_iter_jsons_offsets():
+    text = 'x {"a": 1} y [2]'
+    assert [
+        (text[start:end], value) for start, end, value in json_loader.iter_jsons(text)
+    ] == [('{"a": 1}', {"a": 1}), ("[2]", [2])]
+
+
+def test_braces_and_escapes_inside_strings():
+    text = '{"reason": "uses } and ] and \\" {", "verdict": 1} {"b": 2}'
+    assert json_loader._load_all_jsons(text) == [
+        {"reason": 'uses } and ] and " {', "verdict": 1},
+        {"b": 2},
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": "b"} trailing {', {"a": "b"}),
+        ('Sure [as requested]: {"a": 1}', {"a": 1}),
+    ],
+)
+def test_invalid_starts_are_skipped(text, expected):
+    assert json_loader._load_all_jsons(text) == [expected]
+
+
+@pytest.mark.parametrize("text", ["no json here", "{'a': 1}", '{"a": 1'])
+def test_invalid_json_raises(text):
+    with pytest.raises(ValueError):
+        json_loader._load_all_jsons(text)
+
+
+def test_many_objects_do_not_recurse():
+    text = " ".join('{"i": %d}' % i for i in range(5000))
+    assert len(json_loader._load_all_jsons(text)) == 5000
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": [1, 2,], "b": 3,}', {"a": [1, 2], "b": 3}),
+        ("{'a': 'it's ok'}", {"a": "it's ok"}),
+        (
+            '{"statement": "also known as "Terra" "}',
+            {"statement": 'also known as "Terra" '},
+        ),
+        ('{"a": "already \\" escaped"}', {"a": 'already " escaped'}),
+    ],
+)
+def test_repair_json(text, expected):
+    import json
+
+    from ragas.llms.json_load import repair_json
+
+    assert json.loads(repair_json(text)) == expected
+
+
+@pytest.mark.asyncio
+async def test_safe_load_only_calls_the_llm_when_local_repair_fails(fake_llm):
+    llm = fake_llm
+    llm.respond = lambda prompt_str: '{"fixed": true}'
+    assert await json_loader.safe_load("{'a': 1,}", llm) == {"a": 1}
+    assert llm.calls == 0
+    assert await json_loader.safe_load('{"a": 1', llm) == {"fixed": True}
+    assert llm.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_safe_load_run_config_is_deprecated(fake_llm):
+    from ragas.run_config import RunConfig
+
+    with pytest.warns(DeprecationWarning):
+        assert await json_loader.safe_load(
+            '{"a": 1}', fake_llm, run_config=RunConfig()
+        ) == {"a": 1}
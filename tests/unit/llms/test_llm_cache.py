@@ -0,0 +1,100 @@
+import pytest
+
+from ragas.llms.cache import InMemoryLLMCache, SqliteLLMCache
+from ragas.llms.prompt import PromptValue
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", [True, False])
+async def test_deterministic_calls_are_cached(fake_llm, is_async):
+    llm = fake_llm
+    llm.cache = InMemoryLLMCache()
+    prompt = PromptValue(prompt_str="hello")
+
+    first = await llm.generate(prompt, is_async=is_async)
+    second = await llm.generate(prompt, is_async=is_async)
+
+    assert first.generations[0][0].text == second.generations[0][0].text == "hello"
+    assert llm.calls == 1
+    assert llm.cache is not None
+    assert llm.cache.stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_sampled_calls_are_not_cached(fake_llm):
+    llm = fake_llm
+    llm.cache = InMemoryLLMCache()
+    prompt = PromptValue(prompt_str="hello")
+
+    await llm.generate(prompt, n=3)
+    await llm.generate(prompt, n=3)
+    await llm.generate(prompt, temperature=0.7)
+    await llm.generate(prompt, temperature=0.7)
+
+    assert llm.calls == 4
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryLLMCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_persists(fake_llm, tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite")
+    prompt = PromptValue(prompt_str="hello")
+
+    fake_llm.cache = SqliteLLMCache(path)
+    await fake_llm.generate(prompt)
+
+    # a new cache on the same file, as in the next run
+    fake_llm.cache = SqliteLLMCache(path)
+    result = await fake_llm.generate(prompt)
+    assert result.generations[0][0].text == "hello"
+    assert fake_llm.calls == 1
+
+
+def test_model_identity_tells_apart_model_settings(monkeypatch):
+    from langchain_openai.chat_models import ChatOpenAI
+
+    from ragas.llms.base import LangchainLLMWrapper
+
+    monkeypatch.setenv("OPENAI_API_KEY", "secret-key")
+
+    def identity(**kwargs):
+        return LangchainLLMWrapper(ChatOpenAI(**kwargs)).get_model_identity()
+
+    base = identity(model="gpt-4")
+    assert base == identity(model="gpt-4")
+    assert base != identity(model="gpt-3.5-turbo")
+    assert base != identity(model="gpt-4", temperature=0.5)
+    assert base != identity(model="gpt-4", base_url="http://localhost:8000/v1")
+    assert "secret-key" not in base
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_io_runs_off_the_loop(fake_llm, tmp_path):
+    import threading
+
+    threads = []
+
+    class RecordingCache(SqliteLLMCache):
+        def _get(self, key):
+            threads.append(threading.get_ident())
+            return super()._get(key)
+
+        def set(self, key, value):
+            threads.append(threading.get_ident())
+            super().set(key, value)
+
+    fake_llm.cache = RecordingCache(str(tmp_path / "llm_cache.sqlite"))
+    await fake_llm.generate(PromptValue(prompt_str="hello"))
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
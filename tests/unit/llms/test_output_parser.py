@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from ragas.llms.output_parser import RagasoutputParser, output_parser_counts
+from ragas.llms.prompt import PromptValue
+from ragas.metrics._context_recall import ContextRecallClassificationAnswers
+from ragas.metrics.critique import CriticClassification
+
+CLASSIFICATION = {"statement": "s", "attributed": 1, "reason": "r"}
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        # code fence and text around a single object instead of a list
+        "Here you go:\n```json\n" + json.dumps(CLASSIFICATION) + "\n```\nDone.",
+        # list nested under a key
+        json.dumps({"classifications": [CLASSIFICATION]}),
+        # trailing comma
+        '[{"statement": "s", "attributed": 1, "reason": "r",}]',
+    ],
+)
+@pytest.mark.asyncio
+async def test_repaired_without_llm(fake_llm, output):
+    parser = RagasoutputParser(pydantic_object=ContextRecallClassificationAnswers)
+    llm = fake_llm
+    before = output_parser_counts["repaired"]
+
+    parsed = await parser.aparse(output, PromptValue(prompt_str="p"), llm)
+
+    assert parsed.dicts() == [CLASSIFICATION]
+    assert llm.calls == 0
+    assert output_parser_counts["repaired"] == before + 1
+
+
+@pytest.mark.asyncio
+async def test_missing_and_wrapped_fields_are_filled(fake_llm):
+    parser = RagasoutputParser(pydantic_object=CriticClassification)
+    llm = fake_llm
+
+    parsed = await parser.aparse(
+        '{"result": {"verdict": "1"}}', PromptValue(prompt_str="p"), llm
+    )
+
+    assert parsed == CriticClassification(reason="", verdict=1)
+    assert llm.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_llm_fix_only_when_local_repair_fails(fake_llm):
+    parser = RagasoutputParser(pydantic_object=CriticClassification)
+    llm = fake_llm
+    llm.respond = lambda prompt_str: json.dumps({"reason": "r", "verdict": 0})
+    before = dict(output_parser_counts)
+
+    parsed = await parser.aparse("no json here", PromptValue(prompt_str="p"), llm)
+    assert parsed == CriticClassification(reason="r", verdict=0)
+    assert llm.calls == 1
+    assert output_parser_counts["llm_fixed"] == before.get("llm_fixed", 0) + 1
+
+    llm.respond = lambda prompt_str: "still no json"
+    assert await parser.aparse("no json", PromptValue(prompt_str="p"), llm) is None
+    assert llm.calls == 2
+    assert output_parser_counts["failed"] == before.get("failed", 0) + 1
@@ -1,6 +1,8 @@
 import importlib
 import pkgutil
 
+import pytest
+
 import ragas
 from ragas.llms.prompt import Prompt
 
@@ -121,3 +123,107 @@ def test_prompt_object_names():
                     obj.name not in prompt_object_names
                 ), f"Duplicate prompt name: {obj.name}"
                 prompt_object_names.append(obj.name)
+
+
+def test_prompt_static_prefix():
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    prompt = Prompt(**TESTCASES[0])
+    p_value = prompt.format(question="q", answer="a")
+
+    assert p_value.prompt_str.startswith(prompt.static_prefix)
+    assert p_value.to_messages() == [HumanMessage(content=p_value.to_string())]
+    system, human = p_value.copy(update={"system_prefix": True}).to_messages()
+    assert isinstance(system, SystemMessage) and isinstance(human, HumanMessage)
+    assert system.content == prompt.static_prefix
+    assert system.content + human.content == p_value.to_string()
+    assert human.content == "\nquestion: q\nanswer: a\nstatements in json: \n"
+
+    prompt.instruction = "A new instruction."
+    assert prompt.static_prefix.startswith("A new instruction.")
+    assert prompt.format(question="q", answer="a").prompt_str.startswith(
+        "A new instruction."
+    )
+
+
+def test_prompt_with_inputs_in_instruction():
+    prompt = Prompt(
+        name="answer",
+        instruction="Answer the {question} briefly",
+        input_keys=["question"],
+        output_key="answer",
+        output_type="str",
+    )
+    p_value = prompt.format(question="Q")
+
+    assert p_value.to_string().startswith("Answer the Q briefly")
+    assert p_value.to_string() == prompt.to_string().format(question="Q")
+    assert prompt.static_prefix == ""
+    with pytest.raises(ValueError):
+        prompt.format_batch([{"question": "Q"}])
+
+
+def test_system_prefix_is_opt_in():
+    from langchain_community.chat_models.vertexai import ChatVertexAI
+    from langchain_core.messages import SystemMessage
+    from langchain_openai.chat_models import ChatOpenAI
+
+    from ragas.llms.base import LangchainLLMWrapper
+
+    p_value = Prompt(**TESTCASES[0]).format(question="q", answer="a")
+
+    vertex = ChatVertexAI.construct()
+    openai = ChatOpenAI(api_key="key")
+    for llm in [vertex, openai]:
+        messages = LangchainLLMWrapper(llm)._to_model_prompt(p_value).to_messages()
+        assert len(messages) == 1
+    for llm, system_prefix, expected in [
+        (openai, False, False),
+        (openai, True, True),
+        (vertex, True, True),
+    ]:
+        wrapper = LangchainLLMWrapper(llm, system_prefix=system_prefix)
+        messages = wrapper._to_model_prompt(p_value).to_messages()
+        assert isinstance(messages[0], SystemMessage) == expected
+
+
+def test_prompt_format_matches_template():
+    from ragas.metrics._context_recall import CONTEXT_RECALL_RA
+    from ragas.metrics._faithfulness import NLI_STATEMENTS_MESSAGE
+
+    for prompt in [Prompt(**TESTCASES[0]), CONTEXT_RECALL_RA, NLI_STATEMENTS_MESSAGE]:
+        kwargs = {key: f"value of {key} {{}}" for key in prompt.input_keys}
+        expected = prompt.to_string().format(**kwargs)
+        assert prompt.format(**kwargs).prompt_str == expected
+
+
+def test_prompt_rendering_is_cached():
+    prompt = Prompt(**TESTCASES[0])
+    assert prompt.to_string() is prompt.to_string()
+
+    prompt.examples = []
+    assert "Examples:" not in prompt.to_string()
+    assert "Examples:" not in prompt.format(question="q", answer="a").prompt_str
+
+
+def test_adapt_goes_through_generate(fake_llm, tmp_path):
+    from ragas.llms.cache import InMemoryLLMCache
+
+    llm = fake_llm
+    llm.cache = InMemoryLLMCache()
+    llm.respond = lambda prompt_str: (
+        "{'verdict': 1,}" if "json" in prompt_str else "traduit"
+    )
+    prompt = Prompt(
+        name="adapt-test",
+        instruction="Give a verdict.",
+        examples=[{"question": "q", "verdict": {"verdict": 0}}],
+        input_keys=["question"],
+        output_key="verdict",
+        output_type="json",
+    )
+    prompt.adapt("french", llm, cache_dir=str(tmp_path))
+
+    assert prompt.examples == [{"question": "traduit", "verdict": {"verdict": 1}}]
+    # every call went through llm.generate and its cache
+    assert llm.cache.misses == llm.calls == 2
@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+import pytest
+
+from ragas.checkpoint import CheckpointStore, metric_config_hash, row_fingerprint
+from ragas.metrics import ContextRecall
+
+
+def test_checkpoint_store_roundtrip(tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    key = (row_fingerprint({"question": "q"}), "metric", "config")
+
+    store = CheckpointStore(path=path)
+    store.save(key, 0.5)
+    # NaN scores are retried so they are not saved
+    store.save(("row", "metric", "config"), float("nan"))
+
+    # simulate a run that died halfway through writing a line
+    with open(path, "a") as f:
+        f.write('{"row": "broken", "met')
+
+    resumed = CheckpointStore(path=path)
+    assert len(resumed) == 1
+    assert key in resumed
+    assert resumed.get(key) == 0.5
+    assert json.loads(open(path).readline())["score"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_saves_numpy_scores(tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    key = (row_fingerprint({"question": "q"}), "metric", "config")
+
+    async def score(row):
+        return np.float32(0.25)
+
+    store = CheckpointStore(path=path)
+    assert await store.wrap(score, key)("row") == 0.25
+    assert CheckpointStore(path=path).get(key) == 0.25
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_wrap_skips_finished_jobs(tmp_path):
+    calls = []
+
+    async def score(row):
+        calls.append(row)
+        return 1.0
+
+    store = CheckpointStore(path=str(tmp_path / "checkpoint.jsonl"))
+    key = (row_fingerprint({"question": "q"}), "metric", "config")
+    assert await store.wrap(score, key)("row") == 1.0
+    assert await store.wrap(score, key)("row") == 1.0
+    assert calls == ["row"]
+
+
+def test_metric_config_hash():
+    assert metric_config_hash(ContextRecall()) == metric_config_hash(ContextRecall())
+    assert metric_config_hash(ContextRecall()) != metric_config_hash(
+        ContextRecall(max_retries=3)
+    )
@@ -1 +1,117 @@
 from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import pytest
+
+from ragas.embeddings.base import BaseRagasEmbeddings, CachedEmbeddingsWrapper
+from ragas.embeddings.cache import DiskEmbeddingCache, InMemoryEmbeddingCache
+from ragas.run_config import RunConfig
+
+
+class CountingEmbeddings(BaseRagasEmbeddings):
+    def __init__(self):
+        self.embedded: t.List[str] = []
+        self.set_run_config(RunConfig())
+
+    def embed_query(self, text: str) -> t.List[float]:
+        return self.embed_documents([text])[0]
+
+    def embed_documents(self, texts: t.List[str]) -> t.List[t.List[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    async def aembed_documents(self, texts: t.List[str]) -> t.List[t.List[float]]:
+        return self.embed_documents(texts)
+
+
+@pytest.mark.asyncio
+async def test_cached_embeddings_only_embed_new_texts():
+    counting = CountingEmbeddings()
+    embeddings = CachedEmbeddingsWrapper(counting, cache=InMemoryEmbeddingCache())
+
+    assert await embeddings.embed_texts(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    assert await embeddings.embed_text("bb") == [2.0, 1.0]
+    assert embeddings.embed_documents(["a", "ccc"]) == [[1.0, 1.0], [3.0, 1.0]]
+
+    assert counting.embedded == ["a", "bb", "ccc"]
+    assert embeddings.cache.stats() == {"hits": 2, "misses": 3}
+
+
+def test_disk_embedding_cache_persists(tmp_path):
+    path = str(tmp_path / "embeddings")
+    cache = DiskEmbeddingCache(path)
+    cache.set_many(["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+    cache.set_many(["c"], [[5.0, 6.0]])
+
+    # simulate a run that died after writing the vectors but before the keys
+    with open(cache._vectors_path(2), "ab") as f:
+        f.write(np.zeros(2, dtype=np.float32).tobytes())
+
+    reopened = DiskEmbeddingCache(path)
+    assert reopened.get_many(["c", "a", "d"]) == [[5.0, 6.0], [1.0, 2.0], None]
+    reopened.set_many(["d"], [[7.0, 8.0]])
+    assert DiskEmbeddingCache(path).get_many(["d"]) == [[7.0, 8.0]]
+
+
+def test_disk_embedding_caches_share_a_directory(tmp_path):
+    path = str(tmp_path / "embeddings")
+    first, second = DiskEmbeddingCache(path), DiskEmbeddingCache(path)
+    first.set_many(["ka"], [[1.0, 1.0]])
+    second.set_many(["kb"], [[2.0, 2.0]])
+    first.set_many(["kc"], [[3.0, 3.0, 3.0]])
+
+    assert second.get_many(["kb", "ka", "kc"]) == [
+        [2.0, 2.0],
+        [1.0, 1.0],
+        [3.0, 3.0, 3.0],
+    ]
+    assert first.get_many(["kb"]) == [[2.0, 2.0]]
+
+
+@pytest.mark.asyncio
+async def test_batching_embeddings_merge_concurrent_calls():
+    import asyncio
+
+    from ragas.embeddings.base import BatchingEmbeddingsWrapper
+
+    class RecordingEmbeddings(CountingEmbeddings):
+        def __init__(self):
+            super().__init__()
+            self.batches: t.List[t.List[str]] = []
+
+        async def aembed_documents(self, texts):
+            self.batches.append(texts)
+            return self.embed_documents(texts)
+
+    recording = RecordingEmbeddings()
+    embeddings = BatchingEmbeddingsWrapper(recording, batch_size=3)
+
+    results = await asyncio.gather(
+        *[embeddings.embed_text(text) for text in ["a", "bb", "a", "ccc", "dddd"]]
+    )
+
+    assert results == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [3.0, 1.0], [4.0, 1.0]]
+    # the first batch is sent once full, the rest after the timeout
+    assert recording.batches == [["a", "bb"], ["ccc", "dddd"]]
+
+
+def test_model_identity_tells_apart_embedding_models(monkeypatch):
+    from langchain_openai.embeddings import OpenAIEmbeddings
+
+    from ragas.embeddings.base import LangchainEmbeddingsWrapper
+
+    monkeypatch.setenv("OPENAI_API_KEY", "secret-key")
+
+    def identity(**kwargs):
+        return LangchainEmbeddingsWrapper(
+            OpenAIEmbeddings(**kwargs)
+        ).get_model_identity()
+
+    base = identity(model="text-embedding-3-small")
+    assert base == identity(model="text-embedding-3-small")
+    assert base != identity(model="text-embedding-3-large")
+    assert base != identity(model="text-embedding-3-small", dimensions=256)
+    assert base != identity(model="text-embedding-3-small", base_url="http://local")
+    assert "secret-key" not in base
@@ -0,0 +1,87 @@
+import typing as t
+from dataclasses import dataclass
+
+import pytest
+from datasets import Dataset
+
+from ragas.metrics.base import EvaluationMode, Metric
+from ragas.run_config import RunConfig
+
+
+@dataclass
+class AnswerLength(Metric):
+    name: str = "answer_length"  # type: ignore
+    evaluation_mode: EvaluationMode = EvaluationMode.qa  # type: ignore
+
+    def init(self, run_config: RunConfig):
+        pass
+
+    async def _ascore(self, row: t.Dict, callbacks, is_async: bool) -> float:
+        return len(row["answer"])
+
+
+@pytest.fixture
+def dataset():
+    return Dataset.from_dict(
+        {"question": ["q1", "q2"], "answer": ["a", "abc"], "contexts": [["c1"], ["c2"]]}
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_tracking(monkeypatch):
+    monkeypatch.setattr("ragas.evaluation.track", lambda event: None)
+
+
+@pytest.mark.asyncio
+async def test_aevaluate(dataset):
+    from ragas import aevaluate
+
+    result = await aevaluate(dataset, metrics=[AnswerLength()])
+    assert result.scores["answer_length"] == [1, 3]
+    assert result["answer_length"] == 2
+
+
+def test_evaluate_inside_a_running_loop(dataset):
+    import asyncio
+
+    from ragas import evaluate
+
+    async def evaluate_in_loop():
+        return evaluate(dataset, metrics=[AnswerLength()])
+
+    result = asyncio.run(evaluate_in_loop())
+    assert result.scores["answer_length"] == [1, 3]
+
+
+@dataclass
+class SlowOnSecondRow(Metric):
+    name: str = "slow"  # type: ignore
+    evaluation_mode: EvaluationMode = EvaluationMode.qa  # type: ignore
+
+    def init(self, run_config: RunConfig):
+        pass
+
+    async def _ascore(self, row: t.Dict, callbacks, is_async: bool) -> float:
+        import asyncio
+
+        if row["question"] == "q2":
+            await asyncio.sleep(10)
+        return 1.0
+
+
+@pytest.mark.asyncio
+async def test_failures_and_stats_reach_the_result(dataset):
+    import numpy as np
+
+    from ragas import aevaluate
+
+    run_config = RunConfig(job_timeout=0.05, adaptive_concurrency=True)
+    result = await aevaluate(
+        dataset, metrics=[SlowOnSecondRow()], run_config=run_config
+    )
+
+    assert result.scores["slow"][0] == 1.0
+    assert np.isnan(result.scores["slow"][1])
+    assert list(result.failures) == ["slow-1"]
+    assert "0.05 seconds" in result.failures["slow-1"]
+    assert result.executor_stats["in_flight"] == 0
@@ -1,3 +1,8 @@
+import asyncio
+
+import pytest
+
+
 def test_order_of_execution():
     from ragas.executor import Executor
 
@@ -14,3 +19,216 @@ def test_order_of_execution():
     results = executor.results()
     # Assert
     assert results == list(range(1, 11))
+
+
+def test_jobs_are_started_lazily():
+    from ragas.executor import Executor
+    from ragas.run_config import RunConfig
+
+    max_alive = 0
+    alive = 0
+
+    async def track_alive(index):
+        nonlocal alive, max_alive
+        alive += 1
+        max_alive = max(max_alive, alive)
+        # the first job finishes well before the second one
+        await asyncio.sleep(0.05 * (index + 1))
+        alive -= 1
+        return index
+
+    executor = Executor(run_config=RunConfig(max_workers=2))
+    for i in range(6):
+        executor.submit(track_alive, i, name=f"track_alive_{i}")
+
+    # count the calls of the job thunks, each one creates a coroutine
+    created = 0
+
+    def counted(job):
+        def thunk():
+            nonlocal created
+            created += 1
+            return job()
+
+        return thunk
+
+    executor.jobs = [(counted(job), name) for job, name in executor.jobs]
+
+    results = executor.iter_results()
+    assert created == 0
+    assert next(results) == (0, 0)
+    # the two first jobs and the one that took the slot of the first
+    assert created == 3
+    assert sorted(index for index, _ in results) == list(range(1, 6))
+    assert created == 6
+    assert max_alive == 2
+
+
+def test_iter_results_yields_as_jobs_finish():
+    from ragas.executor import Executor
+
+    async def sleep_and_echo(index, delay):
+        await asyncio.sleep(delay)
+        return index
+
+    executor = Executor()
+    executor.submit(sleep_and_echo, 0, 0.05, name="slow")
+    executor.submit(sleep_and_echo, 1, 0.0, name="fast")
+
+    assert list(executor.iter_results()) == [(1, 1), (0, 0)]
+
+
+@pytest.mark.asyncio
+async def test_streamed_results_are_not_kept():
+    from ragas.executor import Runner
+
+    async def echo(index):
+        return index
+
+    streamed = []
+    runner = Runner(
+        jobs=[(lambda i=i: echo(i), f"echo_{i}") for i in range(5)],
+        desc="streaming",
+        on_result=streamed.append,
+    )
+
+    assert await runner.arun() == []
+    assert sorted(streamed) == list(range(5))
+
+
+def test_failed_jobs_keep_their_index():
+    import numpy as np
+
+    from ragas.executor import Executor
+
+    async def fail_on_odd(index):
+        if index % 2:
+            raise ValueError("odd")
+        return index
+
+    executor = Executor(raise_exceptions=False)
+    for i in range(4):
+        executor.submit(fail_on_odd, i, name=f"fail_on_odd_{i}")
+    results = executor.results()
+
+    assert results[0] == 0 and results[2] == 2
+    assert np.isnan(results[1]) and np.isnan(results[3])
+
+
+def test_adaptive_concurrency_backs_off_and_grows():
+    from ragas.executor import AdaptiveConcurrency
+
+    class RateLimitError(Exception):
+        pass
+
+    concurrency = AdaptiveConcurrency(limit=8, max_limit=16)
+    concurrency.in_flight = 8
+    concurrency.on_job_done(0.1, RateLimitError())
+    assert concurrency.current_limit == 4
+    # the jobs started before the decrease do not decrease it again
+    concurrency.on_job_done(0.1, RateLimitError())
+    assert concurrency.current_limit == 4
+
+    for _ in range(20):
+        concurrency.in_flight = concurrency.current_limit
+        concurrency.on_job_done(0.1, None)
+    assert concurrency.current_limit > 4
+    assert [c[3] for c in concurrency.limit_changes][0] == "RateLimitError"
+    assert concurrency.latency_percentiles()["p50"] == 0.1
+
+
+def test_adaptive_concurrency_adapts_to_slower_jobs():
+    from ragas.executor import AdaptiveConcurrency
+
+    concurrency = AdaptiveConcurrency(limit=16, max_limit=16)
+    # fast jobs first, then jobs that are always 5 times slower
+    for latency in [0.01] * 20 + [0.05] * 500:
+        concurrency.in_flight = concurrency.current_limit
+        concurrency.on_job_done(latency, None)
+
+    latency_decreases = [c for c in concurrency.limit_changes if c[3] == "latency"]
+    assert len(latency_decreases) == 1
+    assert concurrency.current_limit >= 8
+
+
+def test_executor_with_adaptive_concurrency():
+    from ragas.executor import Executor
+    from ragas.run_config import RunConfig
+
+    async def echo(index):
+        await asyncio.sleep(0.001)
+        return index
+
+    executor = Executor(run_config=RunConfig(max_workers=2, adaptive_concurrency=True))
+    for i in range(20):
+        executor.submit(echo, i, name=f"echo_{i}")
+
+    assert executor.results() == list(range(20))
+    assert executor.concurrency is not None
+    assert executor.concurrency.in_flight == 0
+    assert executor.concurrency.current_limit >= 2
+
+
+def test_jobs_past_their_deadline_are_nan():
+    import numpy as np
+
+    from ragas.executor import Executor
+    from ragas.run_config import RunConfig
+
+    async def sleep_and_echo(index, delay):
+        await asyncio.sleep(delay)
+        return index
+
+    executor = Executor(run_config=RunConfig(job_timeout=0.05))
+    executor.submit(sleep_and_echo, 0, 0.0, name="fast")
+    executor.submit(sleep_and_echo, 1, 10, name="hung")
+    results = executor.results()
+
+    assert results[0] == 0
+    assert np.isnan(results[1])
+    assert list(executor.failures) == [1]
+    assert "0.05 seconds" in executor.failures[1]
+
+
+def test_executors_share_one_event_loop():
+    from ragas.executor import Executor
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    loops = []
+    for _ in range(2):
+        executor = Executor()
+        executor.submit(get_loop, name="get_loop")
+        loops.extend(executor.results())
+
+    assert loops[0] is loops[1]
+
+
+def test_executor_inside_a_job_does_not_deadlock():
+    from ragas.executor import Executor
+
+    async def echo(index):
+        return index
+
+    async def run_inner_executor():
+        inner = Executor()
+        inner.submit(echo, 1, name="echo")
+        # blocks the shared loop until the inner jobs are done
+        return inner.results()
+
+    executor = Executor()
+    executor.submit(run_inner_executor, name="outer")
+    assert executor.results() == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_aresults_runs_on_the_callers_loop():
+    from ragas.executor import Executor
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    executor = Executor()
+    executor.submit(get_loop, name="get_loop")
+    assert await executor.aresults() == [asyncio.get_running_loop()]
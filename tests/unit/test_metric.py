@@ -0,0 +1,119 @@
+import asyncio
+import json
+
+import pytest
+
+from ragas.run_config import RunConfig
+
+
+def statements(prompt_str: str) -> str:
+    return json.dumps([{"sentence_index": 0, "simpler_statements": ["s"]}])
+
+
+def verdict(prompt_str: str) -> str:
+    verdict = 0 if "irrelevant" in prompt_str else 1
+    return json.dumps({"reason": "r", "verdict": verdict})
+
+
+@pytest.mark.asyncio
+async def test_row_artifacts_are_computed_once(fake_llm):
+    from ragas.metrics._faithfulness import (
+        LONG_FORM_ANSWER_PROMPT,
+        agenerate_statements,
+    )
+    from ragas.metrics.base import RowArtifacts
+
+    llm = fake_llm
+    llm.respond, llm.delay = statements, 0.01
+    prompt = LONG_FORM_ANSWER_PROMPT.format(question="q", answer="a.", sentences="0:a.")
+
+    async def two_metrics():
+        return await asyncio.gather(
+            agenerate_statements(llm, prompt, [], True),
+            agenerate_statements(llm, prompt, [], True),
+        )
+
+    artifacts = RowArtifacts()
+    first, second = await artifacts.wrap(two_metrics)()
+    assert first is second
+    assert llm.calls == 1
+    assert (artifacts.hits, artifacts.misses) == (1, 1)
+
+    # without RowArtifacts nothing is shared
+    await two_metrics()
+    assert llm.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_row_artifacts_are_released_after_the_last_job():
+    from ragas.metrics.base import RowArtifacts, get_or_compute_artifact
+
+    async def compute():
+        return [0.0] * 8
+
+    async def job():
+        return await get_or_compute_artifact("embedding", "key", compute)
+
+    artifacts = RowArtifacts()
+    first, second = artifacts.wrap(job), artifacts.wrap(job)
+    await first()
+    assert len(artifacts._artifacts) == 1
+    await second()
+    assert artifacts._artifacts == {}
+
+
+@pytest.mark.asyncio
+async def test_context_precision_verifies_contexts_concurrently(fake_llm):
+    from ragas.metrics import ContextPrecision
+
+    llm = fake_llm
+    llm.respond, llm.delay = verdict, 0.01
+    metric = ContextPrecision(llm=llm)
+    row = {
+        "question": "q",
+        "contexts": ["relevant", "irrelevant", "relevant"],
+        "ground_truth": "a",
+    }
+    score = await metric.ascore(row)
+
+    assert llm.max_running == 3
+    assert score == pytest.approx((1 + 2 / 3) / 2)
+
+
+@pytest.mark.asyncio
+async def test_context_precision_stays_under_max_workers(fake_llm):
+    from ragas.metrics import ContextPrecision
+
+    llm = fake_llm
+    llm.respond, llm.delay = verdict, 0.01
+    llm.set_run_config(RunConfig(max_workers=2))
+    metric = ContextPrecision(llm=llm)
+    rows = [
+        {"question": f"q{i}", "contexts": ["relevant"] * 4, "ground_truth": "a"}
+        for i in range(3)
+    ]
+    scores = await asyncio.gather(*[metric.ascore(row) for row in rows])
+
+    # 3 rows with 4 contexts each, but never more than max_workers llm calls
+    assert llm.max_running == 2
+    assert scores == pytest.approx([1.0] * 3)
+
+
+@pytest.mark.asyncio
+async def test_answer_correctness_generates_statements_concurrently(fake_llm):
+    from ragas.metrics import AnswerCorrectness
+
+    def respond(prompt_str: str) -> str:
+        if "TP (true positive)" not in prompt_str:
+            return statements(prompt_str)
+        return json.dumps({"TP": [{"statement": "s"}], "FP": [], "FN": []})
+
+    llm = fake_llm
+    llm.respond, llm.delay = respond, 0.01
+    metric = AnswerCorrectness(llm=llm, weights=[1.0, 0.0])
+    row = {"question": "q", "answer": "It is a.", "ground_truth": "It is b."}
+    score = await metric.ascore(row)
+
+    assert score == 1.0
+    assert llm.calls == 3
+    assert llm.max_running == 2
@@ -0,0 +1,45 @@
+import pytest
+
+from ragas.rate_limiter import RateLimiter
+from ragas.run_config import RunConfig
+
+
+def test_requests_wait_for_budget():
+    limiter = RateLimiter(requests_per_minute=60, burst_seconds=2)
+
+    # two requests fit in the burst, the next ones are spaced by a second
+    assert limiter._reserve(0) == 0
+    assert limiter._reserve(0) == 0
+    assert limiter._reserve(0) == pytest.approx(1, abs=0.05)
+    assert limiter._reserve(0) == pytest.approx(2, abs=0.05)
+
+
+def test_tokens_wait_for_budget():
+    limiter = RateLimiter(tokens_per_minute=600, burst_seconds=1)
+
+    assert limiter._reserve(10) == 0
+    assert limiter._reserve(20) == pytest.approx(2, abs=0.05)
+    # the request used less tokens than estimated
+    limiter.adjust(-20)
+    assert limiter._reserve(10) == pytest.approx(1, abs=0.05)
+
+
+def test_run_config_shares_rate_limiter_per_model():
+    assert RunConfig().get_rate_limiter("gpt") is None
+
+    run_config = RunConfig(requests_per_minute=100)
+    limiter = run_config.get_rate_limiter("gpt")
+    assert limiter is not None
+    assert run_config.get_rate_limiter("gpt") is limiter
+    assert run_config.get_rate_limiter("ada") is not limiter
+
+
+def test_run_config_deepcopy_shares_rate_limiters():
+    import copy
+
+    run_config = RunConfig(requests_per_minute=100)
+    limiter = run_config.get_rate_limiter("gpt")
+
+    copied = copy.deepcopy(run_config)
+    assert copied == run_config
+    assert copied.get_rate_limiter("gpt") is limiter
@@ -173,3 +173,161 @@ def test_docstore_add_batch(fake_llm):
     assert len(store.nodes) == 5
     assert len(store.node_embeddings_list) == 5
     assert len(store.node_map) == 5
+
+
+def test_top_k_matches_similarity():
+    from ragas.testset.docstore import (
+        get_top_k_embeddings,
+        get_top_k_normalized,
+        normalize_embeddings,
+        similarity,
+    )
+
+    gen = np.random.default_rng(0)
+    embeddings = gen.normal(size=(50, 8)).tolist() + [[0.0] * 8]
+    query = gen.normal(size=8)
+
+    exact = sorted(
+        ((similarity(query, e), i) for i, e in enumerate(embeddings[:-1])),
+        reverse=True,
+    )
+    scores, ids = get_top_k_normalized(
+        query, normalize_embeddings(embeddings), similarity_top_k=5
+    )
+    assert ids == [i for _, i in exact[:5]]
+    assert np.allclose(scores, [s for s, _ in exact[:5]], atol=1e-6)
+
+    # the zero embedding has no similarity and is never returned
+    _, ids = get_top_k_embeddings(query, embeddings, similarity_cutoff=0.3)
+    assert ids == [i for s, i in exact if s > 0.3]
+
+
+def test_embedding_matrix_grows_with_nodes():
+    a1, a2, b = create_test_nodes()
+    store = InMemoryDocumentStore(splitter=None)  # type: ignore
+    store.node_embeddings_list.append(a1.embedding)
+    assert store.get_embedding_matrix().shape == (1, len(a1.embedding))
+
+    store.node_embeddings_list.extend([a2.embedding, b.embedding])
+    matrix = store.get_embedding_matrix()
+    assert matrix.dtype == np.float32
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+
+    store.node_embeddings_list = [b.embedding]
+    assert len(store.get_embedding_matrix()) == 1
+
+
+def test_random_nodes_update_wins():
+    nodes = [
+        Node(doc_id=str(i), page_content=str(i), doc_similarity=1.0) for i in range(4)
+    ]
+    # a duplicate of the first node counts its wins on its own
+    nodes.append(nodes[0].copy())
+    store = InMemoryDocumentStore(splitter=None)  # type: ignore
+    store.nodes = nodes
+
+    sampled = store.get_random_nodes(k=20)
+    assert len(sampled) == 20
+    assert store._wins.sum() == 20
+    assert [n.wins for n in nodes] == store._wins.tolist()
+
+    store.nodes.append(Node(doc_id="new", page_content="new", doc_similarity=1.0))
+    store.get_random_nodes(k=1)
+    assert len(store._wins) == 6
+
+
+def test_nodes_docs_similarity_is_updated_per_file():
+    from ragas.testset.docstore import similarity
+
+    gen = np.random.default_rng(0)
+    filenames = ["a", "a", "b", "c", "c", "c"]
+    nodes = [
+        Node(
+            page_content=str(i),
+            metadata={"filename": f},
+            embedding=gen.normal(size=8).tolist(),
+        )
+        for i, f in enumerate(filenames)
+    ]
+    store = InMemoryDocumentStore(splitter=None)  # type: ignore
+
+    def add(new_nodes):
+        store.nodes.extend(new_nodes)
+        store.node_embeddings_list.extend(n.embedding for n in new_nodes)
+        store.calculate_nodes_docs_similarity()
+
+    add(nodes[:4])
+    assert nodes[2].doc_similarity == 1.0
+
+    file_embeddings = store._file_embeddings
+    doc_similarity = file_embeddings.doc_similarity
+    updated_files = []
+
+    def spy(embeddings, files):
+        updated_files.extend(files.tolist())
+        return doc_similarity(embeddings, files)
+
+    file_embeddings.doc_similarity = spy
+    add(nodes[4:])
+    # only the file of the new nodes is updated
+    assert updated_files == [file_embeddings.file_ids["c"]]
+
+    for node in nodes:
+        mean = np.mean([n.embedding for n in nodes if n.filename == node.filename], 0)
+        assert node.doc_similarity == pytest.approx(similarity(node.embedding, mean))
+    assert store._doc_similarity.tolist() == [n.doc_similarity for n in nodes]
+
+
+def test_save_and_load(tmp_path):
+    gen = np.random.default_rng(0)
+    store = InMemoryDocumentStore(splitter=None)  # type: ignore
+    nodes = [
+        Node(
+            page_content=f"content {i}",
+            metadata={"filename": f"file{i // 4}", "page": i},
+            keyphrases=[f"k{i}"],
+            embedding=np.abs(gen.normal(size=8)).tolist(),
+        )
+        for i in range(10)
+    ]
+    store.nodes.extend(nodes)
+    store.node_embeddings_list.extend(n.embedding for n in nodes)
+    store.calculate_nodes_docs_similarity()
+    store.save(str(tmp_path))
+
+    loaded = InMemoryDocumentStore(splitter=None)  # type: ignore
+    loaded.load(str(tmp_path))
+
+    assert [n.doc_id for n in loaded.nodes] == [n.doc_id for n in nodes]
+    for node, loaded_node in zip(nodes, loaded.nodes):
+        assert loaded_node.page_content == node.page_content
+        assert loaded_node.metadata == node.metadata
+        assert loaded_node.keyphrases == node.keyphrases
+        assert isinstance(loaded_node.embedding, np.ndarray)
+        assert np.allclose(loaded_node.embedding, node.embedding)
+        assert loaded_node.doc_similarity == pytest.approx(node.doc_similarity)
+    assert loaded.get_node(nodes[1].doc_id).next is loaded.nodes[2]
+    assert loaded.nodes[3].next is None
+    assert loaded.get_similar(loaded.nodes[0], threshold=0) == store.get_similar(
+        nodes[0], threshold=0
+    )
+
+    with pytest.raises(ValueError):
+        loaded.load(str(tmp_path / "missing"))
+
+
+def test_save_rejects_metadata_that_is_not_json(tmp_path):
+    import datetime
+
+    store = InMemoryDocumentStore(splitter=None)  # type: ignore
+    node = Node(
+        page_content="content",
+        metadata={"filename": "file", "created": datetime.date(2024, 1, 1)},
+        embedding=[1.0, 0.0],
+    )
+    store.nodes.append(node)
+    store.node_embeddings_list.append(node.embedding)
+
+    with pytest.raises(ValueError, match="JSON"):
+        store.save(str(tmp_path / "store"))
+    assert not (tmp_path / "store").exists()
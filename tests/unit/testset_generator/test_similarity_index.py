@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from ragas.testset.similarity_index import (
+    ExactIndex,
+    HnswlibIndex,
+    IVFIndex,
+    normalize_embeddings,
+    recall_at_k,
+)
+
+
+def clustered_embeddings(num_rows=3000, dim=32, num_clusters=20, seed=0):
+    gen = np.random.default_rng(seed)
+    centers = gen.normal(size=(num_clusters, dim))
+    rows = centers[gen.integers(num_clusters, size=num_rows)]
+    return normalize_embeddings(rows + 0.3 * gen.normal(size=(num_rows, dim)))
+
+
+def test_exact_index_has_full_recall():
+    embeddings = clustered_embeddings(num_rows=200)
+    index = ExactIndex()
+    index.update(embeddings)
+    assert recall_at_k(index, embeddings, top_k=5) == 1.0
+
+
+def test_ivf_index():
+    embeddings = clustered_embeddings()
+    index = IVFIndex(num_probes=4)
+    index.update(embeddings[:2000])
+    index.update(embeddings)
+    assert index.size == len(embeddings)
+    assert sum(len(rows) for rows in index._lists) == len(embeddings)
+    assert recall_at_k(index, embeddings, top_k=5) > 0.9
+
+    scores, ids = index.search(embeddings[7], top_k=3, cutoff=0.5)
+    assert ids[0] == 7
+    assert scores == sorted(scores, reverse=True)
+    assert all(score > 0.5 for score in scores)
+
+
+def test_ivf_index_is_exact_when_small():
+    embeddings = clustered_embeddings(num_rows=100)
+    index = IVFIndex()
+    index.update(embeddings)
+    assert recall_at_k(index, embeddings, top_k=5) == 1.0
+
+
+def test_hnswlib_index():
+    pytest.importorskip("hnswlib")
+    embeddings = clustered_embeddings()
+    index = HnswlibIndex()
+    index.update(embeddings)
+    assert recall_at_k(index, embeddings, top_k=5) > 0.9
+
+
+def test_docstore_similarity_index():
+    from ragas.testset.docstore import InMemoryDocumentStore, Node
+
+    embeddings = clustered_embeddings(num_rows=1500)
+    store = InMemoryDocumentStore(splitter=None, similarity_index=IVFIndex())  # type: ignore
+    store.nodes = [
+        Node(page_content=str(i), embedding=e.tolist())
+        for i, e in enumerate(embeddings)
+    ]
+    store.node_embeddings_list = [n.embedding for n in store.nodes]
+
+    similar = store.get_similar(store.nodes[0], threshold=0.0, top_k=2)
+    assert len(similar) == 2
+    assert store.similarity_recall(top_k=3) > 0.9